@@ -0,0 +1,24 @@
+"""Add parquet_s3_key to datasets for columnar ingest
+
+Revision ID: 005_dataset_parquet
+Revises: 004_fk_cascades
+Create Date: 2026-10-15
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "005_dataset_parquet"
+down_revision: Union[str, None] = "004_fk_cascades"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("datasets", sa.Column("parquet_s3_key", sa.String(512), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("datasets", "parquet_s3_key")
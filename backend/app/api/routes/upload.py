@@ -222,6 +222,14 @@ async def upload_dataset(
     csv_bytes = csv_buffer.getvalue()
     storage.upload_file(csv_key, csv_bytes, "text/csv")
 
+    # Columnar copy for model runs: no CSV re-parsing and dtypes are preserved
+    parquet_key = f"datasets/{current_user.workspace_id}/{dataset_id}/data.parquet"
+    try:
+        storage.upload_parquet(parquet_key, df)
+    except Exception:
+        logger.warning(f"Failed to store Parquet copy for dataset {dataset_id}")
+        parquet_key = None
+
     # Auto-detect column mapping
     transformer = DataTransformer()
     auto_mapping_dict = transformer.auto_detect_columns(df)
@@ -271,6 +279,7 @@ async def upload_dataset(
         uploaded_by=current_user.id,
         filename=safe_filename,
         s3_key=csv_key,
+        parquet_s3_key=parquet_key,
         row_count=len(df),
         date_range_start=date_start,
         date_range_end=date_end,
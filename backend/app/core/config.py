@@ -22,12 +22,20 @@ class Settings(BaseSettings):
     jwt_access_token_expire_minutes: int = 15
     jwt_refresh_token_expire_days: int = 7
 
+    # Password hashing (bcrypt cost factor). Unset means 12, or the minimum
+    # of 4 under APP_ENV=test so fixtures don't pay production hashing cost.
+    bcrypt_rounds: int | None = None
+
     # S3 / MinIO
     s3_endpoint_url: str = "http://localhost:9000"
     s3_access_key: str = "minioadmin"
     s3_secret_key: str = "minioadmin"
     s3_bucket_name: str = "mixmodel-uploads"
     s3_region: str = "us-east-1"
+    # "local" stores objects as files under local_storage_dir instead of S3,
+    # for the API, worker and seed script alike (single-machine development).
+    storage_backend: str = "s3"
+    local_storage_dir: str = "./storage"
 
     # Celery
     celery_broker_url: str = "redis://localhost:6379/1"
@@ -39,6 +47,12 @@ class Settings(BaseSettings):
     # Observability
     sentry_dsn: str = ""
 
+    @property
+    def password_hash_rounds(self) -> int:
+        if self.bcrypt_rounds is not None:
+            return self.bcrypt_rounds
+        return 4 if self.app_env == "test" else 12
+
     @property
     def cors_origin_list(self) -> list[str]:
         return [origin.strip() for origin in self.cors_origins.split(",")]
@@ -1,3 +1,5 @@
+from sqlalchemy import JSON
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
@@ -18,6 +20,10 @@ class Base(DeclarativeBase):
     pass
 
 
+# JSONB on PostgreSQL, plain JSON on SQLite (tests and local tooling)
+PortableJSONB = JSONB().with_variant(JSON(), "sqlite")
+
+
 async def get_db() -> AsyncSession:
     async with async_session() as session:
         try:
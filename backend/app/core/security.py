@@ -6,11 +6,16 @@ from passlib.context import CryptContext
 from app.core.config import get_settings
 
 settings = get_settings()
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.password_hash_rounds
+)
 
 
-def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+def hash_password(password: str, rounds: int | None = None) -> str:
+    """Hash a password. ``rounds`` overrides the configured bcrypt cost for this call."""
+    if rounds is None:
+        return pwd_context.hash(password)
+    return pwd_context.handler("bcrypt").using(rounds=rounds).hash(password)
 
 
 def verify_password(plain: str, hashed: str) -> bool:
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Callable
+from typing import BinaryIO, Callable
 
 import pandas as pd
 
@@ -44,8 +44,11 @@ class BaseMMM(ABC):
         ...
 
     @abstractmethod
-    def serialize_model(self) -> bytes:
-        """Serialize the fitted model for storage."""
+    def serialize_model(self, fileobj: BinaryIO | None = None) -> bytes | None:
+        """Serialize the fitted model for storage.
+
+        Writes into fileobj when given (returning None), otherwise returns the bytes.
+        """
         ...
 
     @abstractmethod
@@ -7,10 +7,11 @@ Wraps pymc_marketing.mmm.MMM with our BaseMMM interface.
 import io
 import logging
 import pickle
-from typing import Callable
+from typing import BinaryIO, Callable
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 
 from app.engine.base import BaseMMM
 from app.engine.types import (
@@ -38,13 +39,17 @@ class PyMCMMMEngine(BaseMMM):
         self._spend_data: dict[str, np.ndarray] | None = None
         self._channel_contributions = None
 
-    def prepare_data(self, df: pd.DataFrame, mapping: dict) -> PreparedData:
+    def prepare_data(self, df: pd.DataFrame | pa.Table, mapping: dict) -> PreparedData:
         date_col = mapping["date_column"]
         target_col = mapping["target_column"]
         media_cols = list(mapping["media_columns"].keys())
         control_cols = mapping.get("control_columns", [])
 
-        df = df.copy()
+        if isinstance(df, pa.Table):
+            # Only the mapped columns are converted; the result is already a fresh frame
+            df = df.select([date_col, target_col, *media_cols, *control_cols]).to_pandas()
+        else:
+            df = df.copy()
         df[date_col] = pd.to_datetime(df[date_col])
         df = df.sort_values(date_col).reset_index(drop=True)
 
@@ -113,6 +118,13 @@ class PyMCMMMEngine(BaseMMM):
         target_accept = self.config.get("target_accept", 0.9)
         tune = self.config.get("n_tune", min(n_samples, 1000))
 
+        # Optional sampler overrides; pm.sample's own defaults apply otherwise
+        sample_kwargs = {}
+        if "n_cores" in self.config:
+            sample_kwargs["cores"] = self.config["n_cores"]
+        if "progressbar" in self.config:
+            sample_kwargs["progressbar"] = self.config["progressbar"]
+
         if progress_callback:
             progress_callback(10, f"Sampling: {n_samples} draws x {n_chains} chains...")
 
@@ -124,6 +136,7 @@ class PyMCMMMEngine(BaseMMM):
             draws=n_samples,
             tune=tune,
             random_seed=42,
+            **sample_kwargs,
         )
         self.trace = self.model.idata
 
@@ -570,20 +583,23 @@ class PyMCMMMEngine(BaseMMM):
 
         return curves
 
-    def serialize_model(self) -> bytes:
+    def serialize_model(self, fileobj: BinaryIO | None = None) -> bytes | None:
         """Serialize the fitted model for storage.
 
+        When fileobj is given the pickle is streamed into it and None is
+        returned; otherwise the pickled bytes are returned.
+
         SECURITY WARNING: Uses pickle serialization. NEVER deserialize
         model artifacts from untrusted sources. These files should only
         be loaded by trusted server-side code, never from user input.
         """
-        buf = io.BytesIO()
+        buf = fileobj if fileobj is not None else io.BytesIO()
         pickle.dump({
             "trace": self.trace,
             "config": self.config,
             "channel_columns": list(self.model.channel_columns) if self.model else [],
-        }, buf)
-        return buf.getvalue()
+        }, buf, protocol=pickle.HIGHEST_PROTOCOL)
+        return None if fileobj is not None else buf.getvalue()
 
     def get_diagnostics(self) -> dict:
         diag = self._extract_diagnostics()
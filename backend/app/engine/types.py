@@ -1,4 +1,5 @@
 from dataclasses import asdict, dataclass, field
+from functools import cached_property
 
 import pandas as pd
 
@@ -94,6 +95,60 @@ class EngineResults:
     top_recommendation: str = ""
     response_curves: dict[str, ResponseCurvePoint] = field(default_factory=dict)
     adstock_decay_curves: dict = field(default_factory=dict)
+    # Derived lookups and rankings, built on first access. Results are treated
+    # as immutable once extracted, so the cached values never go stale. As
+    # properties rather than fields, they stay out of to_dict() and the stored
+    # results payload.
+    @cached_property
+    def roas_by_channel(self) -> dict[str, ChannelROAS]:
+        return {r.channel: r for r in self.channel_roas}
+
+    @cached_property
+    def saturation_by_channel(self) -> dict[str, SaturationResult]:
+        return {s.channel: s for s in self.saturation_params}
+
+    @cached_property
+    def adstock_by_channel(self) -> dict[str, AdstockResult]:
+        return {a.channel: a for a in self.adstock_params}
+
+    @cached_property
+    def ranked_contributions(self) -> list[ChannelContribution]:
+        return sorted(self.channel_contributions, key=lambda c: c.share_of_total, reverse=True)
+
+    @cached_property
+    def best_roas_channel(self) -> str | None:
+        return max(self.channel_roas, key=lambda r: r.mean).channel if self.channel_roas else None
+
+    @cached_property
+    def _saturation_leaders(self) -> tuple[str | None, str | None]:
+        """Most saturated channel, and best opportunity scored as ROAS * (1 - saturation)."""
+        most_saturated = None
+        top_opportunity = None
+        most_sat_pct = 0.0
+        best_score = 0.0
+        for cc in self.ranked_contributions:
+            roas = self.roas_by_channel.get(cc.channel)
+            sat = self.saturation_by_channel.get(cc.channel)
+            roas_val = roas.mean if roas else 0.0
+            sat_pct = sat.saturation_pct if sat else 0.0
+
+            if sat_pct > most_sat_pct:
+                most_sat_pct = sat_pct
+                most_saturated = cc.channel
+
+            score = roas_val * (1 - sat_pct)
+            if score > best_score:
+                best_score = score
+                top_opportunity = cc.channel
+        return most_saturated, top_opportunity
+
+    @property
+    def most_saturated_channel(self) -> str | None:
+        return self._saturation_leaders[0]
+
+    @property
+    def top_opportunity_channel(self) -> str | None:
+        return self._saturation_leaders[1]
 
     def to_dict(self) -> dict:
         """Serialize to a JSON-compatible dict. Handles nested dataclasses."""
@@ -1,4 +1,5 @@
 import logging
+import os
 import time
 import uuid as uuid_lib
 
@@ -206,18 +207,23 @@ async def health():
         logger.warning(f"Health check redis failed: {e}")
         checks["redis"] = f"unhealthy: {e}" if settings.app_env == "development" else "unhealthy"
 
-    # Check S3/MinIO
+    # Check S3/MinIO (or the local storage directory)
     try:
-        import boto3
-        s3 = boto3.client(
-            "s3",
-            endpoint_url=settings.s3_endpoint_url,
-            aws_access_key_id=settings.s3_access_key,
-            aws_secret_access_key=settings.s3_secret_key,
-            region_name=settings.s3_region,
-        )
-        s3.list_buckets()
-        checks["storage"] = "healthy"
+        if settings.storage_backend == "local":
+            if not os.access(settings.local_storage_dir, os.W_OK):
+                raise RuntimeError(f"{settings.local_storage_dir} is not writable")
+            checks["storage"] = "healthy"
+        else:
+            import boto3
+            s3 = boto3.client(
+                "s3",
+                endpoint_url=settings.s3_endpoint_url,
+                aws_access_key_id=settings.s3_access_key,
+                aws_secret_access_key=settings.s3_secret_key,
+                region_name=settings.s3_region,
+            )
+            s3.list_buckets()
+            checks["storage"] = "healthy"
     except Exception as e:
         logger.warning(f"Health check storage failed: {e}")
         checks["storage"] = f"unhealthy: {e}" if settings.app_env == "development" else "unhealthy"
@@ -2,10 +2,9 @@ import uuid
 from datetime import date, datetime, timezone
 
 from sqlalchemy import Date, DateTime, ForeignKey, Integer, String
-from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.core.database import Base
+from app.core.database import Base, PortableJSONB
 
 
 class Dataset(Base):
@@ -20,12 +19,13 @@ class Dataset(Base):
     )
     filename: Mapped[str] = mapped_column(String(255), nullable=False)
     s3_key: Mapped[str] = mapped_column(String(512), nullable=False)
+    parquet_s3_key: Mapped[str | None] = mapped_column(String(512), nullable=True)
     row_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
     date_range_start: Mapped[date | None] = mapped_column(Date, nullable=True)
     date_range_end: Mapped[date | None] = mapped_column(Date, nullable=True)
     frequency: Mapped[str] = mapped_column(String(20), default="weekly")
-    column_mapping: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
-    validation_report: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    column_mapping: Mapped[dict | None] = mapped_column(PortableJSONB, nullable=True)
+    validation_report: Mapped[dict | None] = mapped_column(PortableJSONB, nullable=True)
     status: Mapped[str] = mapped_column(String(50), default="pending")
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
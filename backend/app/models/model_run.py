@@ -2,10 +2,9 @@ import uuid
 from datetime import datetime, timezone
 
 from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
-from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.core.database import Base
+from app.core.database import Base, PortableJSONB
 
 
 class ModelRun(Base):
@@ -24,8 +23,8 @@ class ModelRun(Base):
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     status: Mapped[str] = mapped_column(String(50), default="queued")
     progress: Mapped[int] = mapped_column(Integer, default=0)
-    config: Mapped[dict] = mapped_column(JSONB, nullable=False)
-    results: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    config: Mapped[dict] = mapped_column(PortableJSONB, nullable=False)
+    results: Mapped[dict | None] = mapped_column(PortableJSONB, nullable=True)
     model_artifact_s3_key: Mapped[str | None] = mapped_column(String(512), nullable=True)
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
     started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
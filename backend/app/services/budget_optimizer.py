@@ -31,8 +31,9 @@ class BudgetOptimizer:
         current_spends = {}
         for ch in channels:
             curve = response_curves[ch]
-            spend_arrays[ch] = np.array(curve["spend_levels"])
-            contrib_arrays[ch] = np.array(curve["predicted_contribution"])
+            # asarray: curves that are already float arrays are used without a copy
+            spend_arrays[ch] = np.asarray(curve["spend_levels"], dtype=np.float64)
+            contrib_arrays[ch] = np.asarray(curve["predicted_contribution"], dtype=np.float64)
             current_spends[ch] = curve["current_spend"]
 
         def _interp_contribution(channel: str, spend: float) -> float:
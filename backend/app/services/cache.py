@@ -1,7 +1,7 @@
-import json
 import logging
 from typing import Any
 
+import orjson
 import redis
 
 from app.core.config import get_settings
@@ -33,7 +33,7 @@ def get_cached(key: str) -> Any | None:
     try:
         raw = r.get(key)
         if raw:
-            return json.loads(raw)
+            return orjson.loads(raw)
     except Exception:
         logger.warning(f"Cache read failed for key={key}")
     return None
@@ -45,7 +45,7 @@ def set_cached(key: str, value: Any, ttl_seconds: int = 3600) -> None:
     if r is None:
         return
     try:
-        r.setex(key, ttl_seconds, json.dumps(value))
+        r.setex(key, ttl_seconds, orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS))
     except Exception:
         logger.warning(f"Cache write failed for key={key}")
 
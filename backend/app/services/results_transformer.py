@@ -15,9 +15,9 @@ def transform_results(engine_results: EngineResults) -> dict:
     channel_recommendations = generate_channel_interpretation(engine_results)
 
     # Build lookup dicts by channel name
-    roas_by_ch = {r.channel: r for r in engine_results.channel_roas}
-    adstock_by_ch = {a.channel: a for a in engine_results.adstock_params}
-    sat_by_ch = {s.channel: s for s in engine_results.saturation_params}
+    roas_by_ch = engine_results.roas_by_channel
+    adstock_by_ch = engine_results.adstock_by_channel
+    sat_by_ch = engine_results.saturation_by_channel
 
     # Merge into unified channel_results
     channel_results = []
@@ -1,9 +1,20 @@
-"""S3/MinIO storage service for file uploads and model artifacts."""
+"""S3/MinIO storage service for file uploads and model artifacts.
+
+With ``STORAGE_BACKEND=local`` objects are kept as files under
+``LOCAL_STORAGE_DIR`` instead, keyed by the same paths, for development
+without MinIO.
+"""
 
 import io
 import logging
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
 
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from app.core.config import get_settings
@@ -11,19 +22,166 @@ from app.core.config import get_settings
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Objects at least this large are fetched as concurrent byte-range GETs,
+# since a single S3 stream tops out well below NIC bandwidth.
+RANGED_DOWNLOAD_THRESHOLD = 32 * 1024 * 1024  # 32 MB
+RANGED_CHUNK_SIZE = 8 * 1024 * 1024  # 8 MB
+RANGED_MAX_WORKERS = 16
+
+# Sized well above RANGED_MAX_WORKERS so concurrent transfers in one process
+# don't contend for pooled connections; adaptive retries back off under throttling.
+S3_CLIENT_CONFIG = Config(
+    max_pool_connections=64,
+    retries={"mode": "adaptive", "max_attempts": 10},
+    tcp_keepalive=True,
+    connect_timeout=3,
+    read_timeout=60,
+    # Send UNSIGNED-PAYLOAD over HTTPS instead of SHA-256 hashing every body;
+    # botocore still attaches a CRC32 checksum for integrity.
+    s3={"payload_signing_enabled": False},
+)
+
+# Managed uploads of file objects switch to concurrent multipart parts above 8 MB.
+UPLOAD_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=4,
+)
+
+# S3 requires every multipart part except the last to be at least 5 MB.
+MULTIPART_PART_SIZE = 16 * 1024 * 1024  # 16 MB
+
+CSV_BLOCK_SIZE = 16 * 1024 * 1024  # 16 MB
+
+
+def _read_csv_arrow(source):
+    """Parse CSV into a pyarrow Table, converting columns in parallel."""
+    import pyarrow.csv as pacsv
+
+    return pacsv.read_csv(
+        source,
+        read_options=pacsv.ReadOptions(block_size=CSV_BLOCK_SIZE, use_threads=True),
+        # Match pandas: empty cells in text columns are missing, not "".
+        convert_options=pacsv.ConvertOptions(strings_can_be_null=True),
+    )
+
+
+def _object_size(response: dict) -> int:
+    """Total object size from a (possibly ranged) GetObject response."""
+    content_range = response.get("ContentRange")  # "bytes 0-1023/4096"
+    if content_range:
+        return int(content_range.rsplit("/", 1)[1])
+    return response["ContentLength"]
+
+
+class S3MultipartWriter:
+    """Write-only file object that streams its contents to an S3 multipart upload.
+
+    Writes are buffered and sent as a part each time the buffer fills, so
+    peak memory is one part rather than the whole object.
+    """
+
+    def __init__(
+        self,
+        client,
+        bucket: str,
+        key: str,
+        content_type: str = "application/octet-stream",
+        content_encoding: str | None = None,
+    ):
+        self.client = client
+        self.bucket = bucket
+        self.key = key
+        self._buf = bytearray()
+        self._parts: list[dict] = []
+        self.closed = False
+        extra = {"ContentEncoding": content_encoding} if content_encoding else {}
+        self._upload_id = client.create_multipart_upload(
+            Bucket=bucket, Key=key, ContentType=content_type, **extra
+        )["UploadId"]
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        if self.closed:
+            raise ValueError("write to closed S3MultipartWriter")
+        self._buf += data
+        while len(self._buf) >= MULTIPART_PART_SIZE:
+            self._upload_part(bytes(self._buf[:MULTIPART_PART_SIZE]))
+            del self._buf[:MULTIPART_PART_SIZE]
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        """Send the remaining buffer and complete the upload."""
+        if self.closed:
+            return
+        if self._buf or not self._parts:
+            self._upload_part(bytes(self._buf))
+            self._buf.clear()
+        self.client.complete_multipart_upload(
+            Bucket=self.bucket,
+            Key=self.key,
+            UploadId=self._upload_id,
+            MultipartUpload={"Parts": self._parts},
+        )
+        self.closed = True
+
+    def abort(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            self.client.abort_multipart_upload(
+                Bucket=self.bucket, Key=self.key, UploadId=self._upload_id
+            )
+        except ClientError:
+            logger.warning(f"Failed to abort multipart upload: {self.key}")
+
+    def _upload_part(self, body: bytes) -> None:
+        part_number = len(self._parts) + 1
+        response = self.client.upload_part(
+            Bucket=self.bucket,
+            Key=self.key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=body,
+        )
+        self._parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+
 
 class StorageService:
     def __init__(self):
+        self.bucket = settings.s3_bucket_name
+        # Set when the local backend is active; every method then works on files under it
+        self.local_root: Path | None = None
+        if settings.storage_backend == "local":
+            self.client = None
+            self.local_root = Path(settings.local_storage_dir).resolve()
+            self.local_root.mkdir(parents=True, exist_ok=True)
+            return
+
         self.client = boto3.client(
             "s3",
             endpoint_url=settings.s3_endpoint_url,
             aws_access_key_id=settings.s3_access_key,
             aws_secret_access_key=settings.s3_secret_key,
             region_name=settings.s3_region,
+            config=S3_CLIENT_CONFIG,
         )
-        self.bucket = settings.s3_bucket_name
         self._ensure_bucket()
 
+    def _local_path(self, key: str, for_write: bool = False) -> Path:
+        path = (self.local_root / key).resolve()
+        if not path.is_relative_to(self.local_root):
+            raise ValueError(f"Storage key escapes the local storage dir: {key}")
+        if for_write:
+            path.parent.mkdir(parents=True, exist_ok=True)
+        return path
+
     def _ensure_bucket(self):
         try:
             self.client.head_bucket(Bucket=self.bucket)
@@ -32,6 +190,9 @@ class StorageService:
             logger.info(f"Created bucket: {self.bucket}")
 
     def upload_file(self, key: str, data: bytes, content_type: str = "application/octet-stream") -> str:
+        if self.local_root is not None:
+            self._local_path(key, for_write=True).write_bytes(data)
+            return key
         self.client.put_object(
             Bucket=self.bucket,
             Key=key,
@@ -40,18 +201,152 @@ class StorageService:
         )
         return key
 
-    def download_file(self, key: str) -> bytes:
-        response = self.client.get_object(Bucket=self.bucket, Key=key)
-        return response["Body"].read()
+    def upload_fileobj(self, key: str, fileobj, content_type: str = "application/octet-stream") -> str:
+        """Upload from a readable file object without materializing it as bytes."""
+        if self.local_root is not None:
+            path = self._local_path(key, for_write=True)
+            with open(path, "wb") as f:
+                shutil.copyfileobj(fileobj, f)
+            return key
+        self.client.upload_fileobj(
+            fileobj,
+            self.bucket,
+            key,
+            ExtraArgs={"ContentType": content_type},
+            Config=UPLOAD_TRANSFER_CONFIG,
+        )
+        return key
+
+    @contextmanager
+    def upload_stream(
+        self,
+        key: str,
+        content_type: str = "application/octet-stream",
+        content_encoding: str | None = None,
+    ):
+        """Yield a file object whose writes are streamed to ``key`` as a multipart upload.
+
+        The upload is completed when the block exits. It is aborted if the block
+        raises or completing it fails, so no incomplete upload is left behind.
+        """
+        if self.local_root is not None:
+            path = self._local_path(key, for_write=True)
+            with open(path, "wb") as f:
+                try:
+                    yield f
+                except BaseException:
+                    f.close()
+                    path.unlink(missing_ok=True)
+                    raise
+            return
+        writer = S3MultipartWriter(self.client, self.bucket, key, content_type, content_encoding)
+        try:
+            yield writer
+            # Inside the guard: a failed final part or completion must abort too
+            writer.close()
+        except BaseException:
+            writer.abort()
+            raise
+
+    def download_file(self, key: str) -> bytes | bytearray:
+        """Return an object's contents.
+
+        Objects up to RANGED_DOWNLOAD_THRESHOLD take a single GET. Larger ones
+        are returned as the bytearray the ranged download filled, not a copy.
+        """
+        if self.local_root is not None:
+            return self._local_path(key).read_bytes()
+        response = self._get_leading_range(key)
+        size = _object_size(response)
+        if size <= RANGED_DOWNLOAD_THRESHOLD:
+            return response["Body"].read()
+        return self._download_ranged(key, size, response)
 
     def download_csv(self, key: str):
-        """Download a CSV file from S3 and return as a pandas DataFrame."""
-        import pandas as pd
+        """Download a CSV file from S3 and return as a pandas DataFrame.
+
+        Parsing uses Arrow's multi-threaded CSV reader. Small objects are
+        handed to the parser as a stream, so the raw bytes are never buffered
+        alongside the parsed frame. Large objects are fetched with parallel
+        ranged GETs first.
+        """
+        return self._download_csv_table(key).to_pandas(self_destruct=True, split_blocks=True)
+
+    def upload_parquet(self, key: str, df) -> str:
+        """Store a DataFrame as a zstd-compressed Parquet object."""
+        buf = io.BytesIO()
+        df.to_parquet(buf, engine="pyarrow", compression="zstd", index=False)
+        buf.seek(0)
+        return self.upload_fileobj(key, buf, "application/vnd.apache.parquet")
+
+    def download_arrow(self, csv_key: str, parquet_key: str | None = None):
+        """Load a dataset as a pyarrow Table, preferring its Parquet copy.
+
+        Callers that only need some columns can select them before converting
+        to pandas, instead of materializing the whole frame.
+        """
+        if parquet_key:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            if self.local_root is not None:
+                return pq.read_table(self._local_path(parquet_key))
+            # BufferReader wraps bytes/bytearray without copying
+            return pq.read_table(pa.BufferReader(self.download_file(parquet_key)))
+        return self._download_csv_table(csv_key)
+
+    def _download_csv_table(self, key: str):
+        if self.local_root is not None:
+            return _read_csv_arrow(str(self._local_path(key)))
+        response = self._get_leading_range(key)
+        size = _object_size(response)
+        if size <= RANGED_DOWNLOAD_THRESHOLD:
+            return _read_csv_arrow(response["Body"])
+        import pyarrow as pa
+
+        return _read_csv_arrow(pa.BufferReader(self._download_ranged(key, size, response)))
+
+    def _get_leading_range(self, key: str) -> dict:
+        """GET the first RANGED_DOWNLOAD_THRESHOLD bytes of an object.
+
+        This is the whole object in the common case, and otherwise reports the
+        total size in ContentRange, so no separate HEAD is needed.
+        """
+        try:
+            return self.client.get_object(
+                Bucket=self.bucket, Key=key, Range=f"bytes=0-{RANGED_DOWNLOAD_THRESHOLD - 1}"
+            )
+        except ClientError as exc:
+            # S3 rejects any range on an empty object
+            if exc.response.get("Error", {}).get("Code") != "InvalidRange":
+                raise
+            return self.client.get_object(Bucket=self.bucket, Key=key)
+
+    def _download_ranged(self, key: str, size: int, leading: dict) -> bytearray:
+        """Fill one preallocated buffer from the leading GET plus concurrent byte-range GETs."""
+        buf = bytearray(size)
+        view = memoryview(buf)
+        start = RANGED_DOWNLOAD_THRESHOLD
+
+        def _fetch(offset: int) -> None:
+            end = min(offset + RANGED_CHUNK_SIZE, size) - 1
+            response = self.client.get_object(
+                Bucket=self.bucket, Key=key, Range=f"bytes={offset}-{end}"
+            )
+            view[offset:end + 1] = response["Body"].read()
 
-        data = self.download_file(key)
-        return pd.read_csv(io.BytesIO(data))
+        with ThreadPoolExecutor(max_workers=RANGED_MAX_WORKERS) as pool:
+            results = pool.map(_fetch, range(start, size, RANGED_CHUNK_SIZE))
+            # The leading range is read here while the rest are fetched
+            view[:start] = leading["Body"].read()
+            # list() re-raises the first failed range, if any
+            list(results)
+        return buf
 
     def delete_file(self, key: str):
+        if self.local_root is not None:
+            self._local_path(key).unlink(missing_ok=True)
+            return
         try:
             self.client.delete_object(Bucket=self.bucket, Key=key)
         except ClientError:
@@ -59,6 +354,11 @@ class StorageService:
 
     def delete_prefix(self, prefix: str):
         """Delete all objects under a given prefix."""
+        if self.local_root is not None:
+            for path in self.local_root.rglob("*"):
+                if path.is_file() and path.relative_to(self.local_root).as_posix().startswith(prefix):
+                    path.unlink()
+            return
         try:
             paginator = self.client.get_paginator("list_objects_v2")
             for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
@@ -68,6 +368,9 @@ class StorageService:
             logger.warning(f"Failed to delete S3 prefix: {prefix}")
 
     def generate_presigned_url(self, key: str, expires_in: int = 3600) -> str:
+        if self.local_root is not None:
+            # Only meaningful to a client on the same machine
+            return self._local_path(key).as_uri()
         return self.client.generate_presigned_url(
             "get_object",
             Params={"Bucket": self.bucket, "Key": key},
@@ -13,24 +13,19 @@ def generate_summary(results: EngineResults) -> tuple[str, str]:
     Returns:
         (summary_text, top_recommendation)
     """
-    contributions = results.channel_contributions
-    roas_list = results.channel_roas
-    saturation_list = results.saturation_params
     adstock_list = results.adstock_params
 
-    if not contributions:
+    if not results.channel_contributions:
         return "No channel results available.", ""
 
-    # Build lookup dicts
-    roas_by_ch = {r.channel: r for r in roas_list}
-    sat_by_ch = {s.channel: s for s in saturation_list}
+    roas_by_ch = results.roas_by_channel
+    sat_by_ch = results.saturation_by_channel
 
-    # Sort by contribution share descending
-    ranked = sorted(contributions, key=lambda c: c.share_of_total, reverse=True)
+    # Ranked by contribution share descending
+    ranked = results.ranked_contributions
     top = ranked[0]
 
-    # Best ROAS channel
-    best_roas = max(roas_list, key=lambda r: r.mean) if roas_list else None
+    best_roas = roas_by_ch.get(results.best_roas_channel)
 
     marketing_pct = 1 - results.base_sales_pct
     base_pct = results.base_sales_pct
@@ -66,14 +61,16 @@ def generate_summary(results: EngineResults) -> tuple[str, str]:
             f"${best_roas.mean:.2f} per dollar spent.\n"
         )
 
+    # Per-channel (contribution, roas, saturation_pct) resolved once for all sections
+    metrics = _channel_metrics(ranked, roas_by_ch, sat_by_ch)
+
     # Channel rankings
     lines.append("### Channel Rankings by Contribution:\n")
-    for i, cc in enumerate(ranked, 1):
-        roas = roas_by_ch.get(cc.channel)
-        sat = sat_by_ch.get(cc.channel)
+    for i, (cc, roas, sat_pct) in enumerate(metrics, 1):
+        ch = cc.channel
         roas_str = f"ROAS: ${roas.mean:.2f}" if roas else "ROAS: N/A"
-        line = f"{i}. **{cc.channel}**: {cc.share_of_total:.0%} of marketing effect ({roas_str})"
-        if sat and sat.saturation_pct > 0.8:
+        line = f"{i}. **{ch}**: {cc.share_of_total:.0%} of marketing effect ({roas_str})"
+        if sat_pct > 0.8:
             line += " - Approaching saturation"
         lines.append(line)
 
@@ -96,8 +93,7 @@ def generate_summary(results: EngineResults) -> tuple[str, str]:
 
     # Recommendations
     lines.append("### Key Recommendations:\n")
-    recs = _generate_recommendations(ranked, roas_by_ch, sat_by_ch)
-    lines.append(recs)
+    lines.append(_generate_recommendations(metrics))
 
     # Diagnostics note
     diag = results.diagnostics
@@ -118,7 +114,7 @@ def generate_summary(results: EngineResults) -> tuple[str, str]:
     summary_text = "\n".join(lines)
 
     # ---- Top recommendation ----
-    top_rec = _generate_top_recommendation(ranked, roas_by_ch, sat_by_ch)
+    top_rec = _generate_top_recommendation(results)
 
     return summary_text, top_rec
 
@@ -128,9 +124,9 @@ def generate_channel_interpretation(results: EngineResults) -> dict[str, str]:
 
     Returns dict mapping channel name -> interpretation string.
     """
-    roas_by_ch = {r.channel: r for r in results.channel_roas}
-    sat_by_ch = {s.channel: s for s in results.saturation_params}
-    adstock_by_ch = {a.channel: a for a in results.adstock_params}
+    roas_by_ch = results.roas_by_channel
+    sat_by_ch = results.saturation_by_channel
+    adstock_by_ch = results.adstock_by_channel
 
     interpretations = {}
 
@@ -191,17 +187,20 @@ def generate_channel_interpretation(results: EngineResults) -> dict[str, str]:
     return interpretations
 
 
-def _generate_recommendations(
-    ranked: list, roas_by_ch: dict, sat_by_ch: dict
-) -> str:
+def _channel_metrics(ranked: list, roas_by_ch: dict, sat_by_ch: dict) -> list[tuple]:
+    """Resolve (contribution, roas, saturation_pct) for each ranked channel."""
+    metrics = []
+    for cc in ranked:
+        sat = sat_by_ch.get(cc.channel)
+        metrics.append((cc, roas_by_ch.get(cc.channel), sat.saturation_pct if sat else 0.0))
+    return metrics
+
+
+def _generate_recommendations(metrics: list[tuple]) -> str:
     recs = []
 
-    for cc in ranked:
+    for cc, roas, sat_pct in metrics:
         ch = cc.channel
-        sat = sat_by_ch.get(ch)
-        roas = roas_by_ch.get(ch)
-
-        sat_pct = sat.saturation_pct if sat else 0.0
         roas_val = roas.mean if roas else 0.0
 
         if sat_pct > 0.85:
@@ -226,35 +225,11 @@ def _generate_recommendations(
     return "\n".join(recs)
 
 
-def _generate_top_recommendation(
-    ranked: list, roas_by_ch: dict, sat_by_ch: dict
-) -> str:
+def _generate_top_recommendation(results: EngineResults) -> str:
     """Generate the single most important recommendation."""
-    # Find the most saturated channel
-    most_saturated = None
-    most_sat_pct = 0.0
-
-    # Find the best opportunity channel (high ROAS + low saturation)
-    best_opportunity = None
-    best_score = 0.0
-
-    for cc in ranked:
-        ch = cc.channel
-        sat = sat_by_ch.get(ch)
-        roas = roas_by_ch.get(ch)
-
-        sat_pct = sat.saturation_pct if sat else 0.0
-        roas_val = roas.mean if roas else 0.0
-
-        if sat_pct > most_sat_pct:
-            most_sat_pct = sat_pct
-            most_saturated = ch
-
-        # Score = ROAS * (1 - saturation) -- higher is better opportunity
-        score = roas_val * (1 - sat_pct)
-        if score > best_score:
-            best_score = score
-            best_opportunity = ch
+    most_saturated = results.most_saturated_channel
+    best_opportunity = results.top_opportunity_channel
+    most_sat_pct = results.saturation_by_channel[most_saturated].saturation_pct if most_saturated else 0.0
 
     if most_saturated and best_opportunity and most_saturated != best_opportunity and most_sat_pct > 0.7:
         return (
@@ -262,9 +237,11 @@ def _generate_top_recommendation(
             f"to {best_opportunity} for higher marginal returns."
         )
     elif best_opportunity:
-        roas = roas_by_ch.get(best_opportunity)
-        roas_str = f"${roas.mean:.2f}" if roas else "strong"
-        return f"Increase {best_opportunity} investment -- best opportunity with {roas_str} ROAS and room to grow."
+        # A positive score implies a ROAS entry exists for this channel
+        return (
+            f"Increase {best_opportunity} investment -- best opportunity with "
+            f"${results.roas_by_channel[best_opportunity].mean:.2f} ROAS and room to grow."
+        )
     else:
         return "Current budget allocation appears well-balanced."
 
@@ -6,10 +6,17 @@ and the data scientist's engine (PyMCMMMEngine).
 
 import json
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
+import numpy as np
+import orjson
 import redis
+import zstandard as zstd
 from celery.exceptions import SoftTimeLimitExceeded
+from sqlalchemy import text
 
 from app.core.config import get_settings
 from app.tasks.celery_app import celery_app
@@ -18,7 +25,20 @@ logger = logging.getLogger(__name__)
 settings = get_settings()
 
 
+# Sampler progress is throttled: repeated ticks at the same percentage are
+# published at most every PROGRESS_MIN_INTERVAL_S, and the DB row is only
+# committed when progress has moved by PROGRESS_COMMIT_STEP points.
+PROGRESS_MIN_INTERVAL_S = 2.0
+PROGRESS_COMMIT_STEP = 5
+HEARTBEAT_TTL_S = 30
+ARTIFACT_ZSTD_LEVEL = 3
+
+# Progress ticks bypass the ORM unit of work (no autoflush or dirty-state diffing).
+# model_runs has no onupdate columns, so nothing else needs setting here.
+_UPDATE_PROGRESS = text("UPDATE model_runs SET progress = :progress, status = :status WHERE id = :id")
+
 _redis_client: redis.Redis | None = None
+_db_engine = None
 
 
 def _get_redis() -> redis.Redis:
@@ -29,6 +49,50 @@ def _get_redis() -> redis.Redis:
     return _redis_client
 
 
+_JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _plain_keys(obj):
+    """Copy of ``obj`` with numpy scalar dict keys converted to Python scalars."""
+    if isinstance(obj, dict):
+        return {(k.item() if isinstance(k, np.generic) else k): _plain_keys(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_plain_keys(v) for v in obj]
+    return obj
+
+
+def _json_serializer(obj) -> str:
+    """Serialize JSONB values with orjson (numpy-aware) instead of the stdlib json module.
+
+    Non-string keys are stringified as json.dumps would. NaN and Infinity are
+    written as null; PostgreSQL rejects the NaN tokens json.dumps emits.
+    """
+    try:
+        return orjson.dumps(obj, option=_JSON_OPTIONS).decode()
+    except TypeError:
+        # orjson only accepts builtin scalar keys; numpy ones need converting first
+        return orjson.dumps(_plain_keys(obj), option=_JSON_OPTIONS).decode()
+
+
+def _get_db_engine():
+    """Return the worker's SQLAlchemy engine, creating it on first use.
+
+    Created lazily so each forked Celery worker process builds its own pool,
+    which is then reused across tasks instead of being rebuilt per run.
+    """
+    global _db_engine
+    if _db_engine is None:
+        from sqlalchemy import create_engine
+
+        engine_kwargs: dict = {}
+        if "sqlite" not in settings.database_url_sync:
+            engine_kwargs.update(pool_size=5, max_overflow=10, pool_pre_ping=True, pool_recycle=1800)
+        _db_engine = create_engine(
+            settings.database_url_sync, json_serializer=_json_serializer, **engine_kwargs
+        )
+    return _db_engine
+
+
 def _publish_progress(run_id: str, progress: int, message: str, stage: str, eta_seconds: int | None = None):
     """Publish progress event via Redis pub/sub for SSE streaming."""
     r = _get_redis()
@@ -40,20 +104,97 @@ def _publish_progress(run_id: str, progress: int, message: str, stage: str, eta_
     }
     if eta_seconds is not None:
         event["eta_seconds"] = eta_seconds
-    r.publish(f"model_progress:{run_id}", json.dumps(event))
+    # One round trip for the event and the worker heartbeat
+    with r.pipeline(transaction=False) as pipe:
+        pipe.publish(f"model_progress:{run_id}", json.dumps(event))
+        pipe.setex(f"model_heartbeat:{run_id}", HEARTBEAT_TTL_S, progress)
+        pipe.execute()
+
+
+def _make_progress_callback(db, run_id: str, start: int):
+    """Build the sampler progress callback, throttled as described above.
+
+    Engine progress (0-100) is scaled into the task's 25-85 fitting range. The
+    100% tick is never throttled, so the row always ends at the top of the range.
+    """
+    last_published = [start, time.monotonic()]  # [progress, monotonic time]
+    last_committed = [start]
+
+    def progress_callback(pct: int, msg: str):
+        scaled = 25 + int((pct / 100) * 60)
+        done = pct >= 100
+        now = time.monotonic()
+        if not done and scaled == last_published[0] and now - last_published[1] < PROGRESS_MIN_INTERVAL_S:
+            return
+        last_published[0], last_published[1] = scaled, now
+
+        if done or abs(scaled - last_committed[0]) >= PROGRESS_COMMIT_STEP:
+            db.execute(_UPDATE_PROGRESS, {"progress": scaled, "status": "fitting", "id": run_id})
+            db.commit()
+            last_committed[0] = scaled
+        _publish_progress(run_id, scaled, msg, "fitting")
+
+    return progress_callback
+
+
+class _UploadCancelled(Exception):
+    pass
+
+
+class _CancellableWriter:
+    """Pass-through writer that raises once ``cancel`` is set, aborting the upload."""
+
+    def __init__(self, raw, cancel: threading.Event):
+        self._raw = raw
+        self._cancel = cancel
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        if self._cancel.is_set():
+            raise _UploadCancelled()
+        return self._raw.write(data)
+
+    def flush(self) -> None:
+        self._raw.flush()
+
+
+def _upload_artifact(storage, mmm, artifact_key: str, cancel: threading.Event) -> bool:
+    """Stream the zstd-compressed model pickle to S3. Returns False on failure.
+
+    Setting ``cancel`` makes the next write fail, so the multipart upload is
+    aborted instead of running on after the task has given up.
+    """
+    try:
+        cctx = zstd.ZstdCompressor(level=ARTIFACT_ZSTD_LEVEL, threads=-1)
+        with storage.upload_stream(artifact_key, content_encoding="zstd") as writer:
+            # closefd=False: the upload is completed (or aborted) by upload_stream
+            with cctx.stream_writer(_CancellableWriter(writer, cancel), closefd=False) as compressed:
+                mmm.serialize_model(compressed)
+        return True
+    except _UploadCancelled:
+        logger.warning(f"Cancelled model artifact upload for {artifact_key}")
+        return False
+    except Exception:
+        logger.warning(f"Failed to serialize model artifact for {artifact_key}")
+        return False
 
 
 @celery_app.task(bind=True, max_retries=1, time_limit=3600, soft_time_limit=3300)
 def run_mmm_model(self, model_run_id: str):
     """Celery task: load data, fit model, store results."""
-    from sqlalchemy import create_engine
     from sqlalchemy.orm import Session
 
     from app.models.dataset import Dataset
     from app.models.model_run import ModelRun
     from app.services.storage import StorageService
 
-    engine = create_engine(settings.database_url_sync)
+    engine = _get_db_engine()
+    # Background S3 transfers, overlapped with the engine import and DB writes
+    io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"mmm-io-{model_run_id[:8]}")
+    io_cancel = threading.Event()
+    succeeded = False
 
     try:
         try:
@@ -84,14 +225,16 @@ def run_mmm_model(self, model_run_id: str):
                 db.commit()
                 _publish_progress(model_run_id, 5, "Loading data...", "preprocessing")
 
-                # Load data from S3
+                # Load data from S3 while the engine import runs
                 storage = StorageService()
-                df = storage.download_csv(dataset.s3_key)
-                _publish_progress(model_run_id, 10, "Data loaded, preparing model...", "preprocessing")
+                table_future = io_pool.submit(storage.download_arrow, dataset.s3_key, dataset.parquet_s3_key)
 
                 # Import engine here to avoid heavy imports at module level
                 from app.engine.pymc_engine import PyMCMMMEngine
 
+                table = table_future.result()
+                _publish_progress(model_run_id, 10, "Data loaded, preparing model...", "preprocessing")
+
                 # Build and fit model
                 mmm = PyMCMMMEngine(model_run.config)
 
@@ -101,7 +244,7 @@ def run_mmm_model(self, model_run_id: str):
                 db.commit()
                 _publish_progress(model_run_id, 15, "Preparing data for model...", "preprocessing")
 
-                prepared = mmm.prepare_data(df, dataset.column_mapping)
+                prepared = mmm.prepare_data(table, dataset.column_mapping)
 
                 # Build model
                 model_run.progress = 20
@@ -116,14 +259,7 @@ def run_mmm_model(self, model_run_id: str):
                 db.commit()
                 _publish_progress(model_run_id, 25, "Starting MCMC sampling...", "fitting")
 
-                def progress_callback(pct: int, msg: str):
-                    # Scale engine progress (5-90) to our range (25-85)
-                    scaled = 25 + int((pct / 100) * 60)
-                    model_run.progress = scaled
-                    model_run.status = "fitting"
-                    db.commit()
-                    _publish_progress(model_run_id, scaled, msg, "fitting")
-
+                progress_callback = _make_progress_callback(db, model_run_id, start=25)
                 mmm.fit(prepared, progress_callback=progress_callback)
 
                 # Extract results
@@ -136,21 +272,18 @@ def run_mmm_model(self, model_run_id: str):
                 from app.services.results_transformer import transform_results
                 results_dict = transform_results(results)
 
-                # Upload model artifact to S3
+                # Upload model artifact to S3 while the results are written
+                _publish_progress(model_run_id, 95, "Saving model artifact...", "postprocessing")
+                # Nothing reads the artifact back yet; a loader must zstd-decompress before unpickling
+                artifact_key = f"artifacts/{model_run.workspace_id}/{model_run_id}/model.pkl.zst"
+                artifact_future = io_pool.submit(_upload_artifact, storage, mmm, artifact_key, io_cancel)
+
+                model_run.results = results_dict
                 model_run.progress = 95
                 db.commit()
-                _publish_progress(model_run_id, 95, "Saving model artifact...", "postprocessing")
 
-                try:
-                    artifact_bytes = mmm.serialize_model()
-                    artifact_key = f"artifacts/{model_run.workspace_id}/{model_run_id}/model.pkl"
-                    storage.upload_file(artifact_key, artifact_bytes, "application/octet-stream")
+                if artifact_future.result():
                     model_run.model_artifact_s3_key = artifact_key
-                except Exception:
-                    logger.warning(f"Failed to serialize model artifact for {model_run_id}")
-
-                # Save results
-                model_run.results = results_dict
                 model_run.status = "completed"
                 model_run.progress = 100
                 model_run.completed_at = datetime.now(timezone.utc)
@@ -158,6 +291,7 @@ def run_mmm_model(self, model_run_id: str):
 
                 _publish_progress(model_run_id, 100, "Model complete!", "done")
                 logger.info(f"Model run {model_run_id} completed successfully")
+                succeeded = True
 
         except SoftTimeLimitExceeded:
             logger.warning(f"Model run {model_run_id} exceeded soft time limit")
@@ -188,4 +322,8 @@ def run_mmm_model(self, model_run_id: str):
         _publish_progress(model_run_id, 0, f"Error: {exc}", "error")
         raise
     finally:
-        engine.dispose()
+        if not succeeded:
+            # Don't block on an in-flight transfer past the soft time limit;
+            # a running artifact upload aborts at its next write.
+            io_cancel.set()
+        io_pool.shutdown(wait=succeeded, cancel_futures=True)
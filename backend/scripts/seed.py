@@ -1,137 +1,166 @@
 """Seed demo data for development/demo purposes.
 
-Usage: cd backend && python -m scripts.seed
+Usage: cd backend && python -m scripts.seed [--fast-hash]
+
+--fast-hash hashes the demo passwords at the minimum bcrypt cost, for
+throwaway local databases.
 """
 
+import argparse
+import hashlib
 import io
-import csv
-import math
-import random
-import uuid
-from datetime import datetime, timedelta, date
-
-from sqlalchemy import create_engine, select
+import mmap
+import os
+from datetime import datetime, date
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import create_engine
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
+from app.core.ids import new_id
 from app.core.security import hash_password
 from app.models.user import User
 from app.models.workspace import Workspace
 from app.models.dataset import Dataset
 
+# Bump when generate_sample_csv output changes, to invalidate cached copies.
+SAMPLE_CSV_VERSION = 2
+SAMPLE_CSV_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "mmm"
+
+# ISO weeks flagged as holidays (Black Friday week, Christmas, New Year)
+_HOLIDAY_WEEKS = np.array([1, 47, 48, 51, 52])
+
+
+def generate_sample_csv(n_weeks: int = 104) -> bytes:
+    """Generate a realistic marketing CSV with known patterns, as ASCII bytes."""
+    rng = np.random.default_rng(42)
+    # One draw for every noise term: google, facebook, tv (burst), tv (base), email, revenue
+    z = rng.standard_normal((n_weeks, 6))
+
+    dates = pd.date_range(datetime(2023, 1, 2), periods=n_weeks, freq="7D")  # First Monday of 2023
+    week_of_year = dates.isocalendar().week.to_numpy(dtype=np.int64)
+
+    # Seasonality (peak in Q4)
+    season = 1 + 0.3 * np.sin(2 * np.pi * (week_of_year - 13) / 52)
+
+    # Channel spends with some correlation
+    google = np.maximum(0, (5000 + 1500 * z[:, 0]) * season)
+    facebook = np.maximum(0, (3000 + 1000 * z[:, 1]) * season)
+    tv = np.maximum(
+        0,
+        np.where(week_of_year % 4 == 0, 8000 + 3000 * z[:, 2], 2000 + 800 * z[:, 3]),
+    )
+    email_spend = np.maximum(0, 500 + 200 * z[:, 4])
+
+    is_holiday = np.isin(week_of_year, _HOLIDAY_WEEKS).astype(np.int64)
+
+    # Revenue = base + channel effects + noise
+    base = 50000 * season
+    google_effect = google * 2.5 * (1 - google / 20000)  # Diminishing returns
+    facebook_effect = facebook * 1.8 * (1 - facebook / 15000)
+    tv_effect = tv * 1.2 * (1 - tv / 30000)
+    email_effect = email_spend * 3.0
+    holiday_effect = 15000 * is_holiday
+
+    revenue = base + google_effect + facebook_effect + tv_effect + email_effect + holiday_effect
+    revenue += 3000 * z[:, 5]  # Noise
+    revenue = np.maximum(0, revenue)
+
+    df = pd.DataFrame({
+        "date": dates.strftime("%Y-%m-%d"),
+        "revenue": revenue,
+        "google_ads": google,
+        "facebook": facebook,
+        "tv": tv,
+        "email": email_spend,
+        "is_holiday": is_holiday,
+    })
+    buf = io.BytesIO()
+    df.to_csv(buf, mode="wb", encoding="ascii", index=False, float_format="%.2f", lineterminator="\n")
+    return buf.getvalue()
 
-def generate_sample_csv(n_weeks: int = 104) -> str:
-    """Generate a realistic marketing CSV with known patterns."""
-    random.seed(42)
-    buf = io.StringIO()
-    writer = csv.writer(buf)
-    writer.writerow(["date", "revenue", "google_ads", "facebook", "tv", "email", "is_holiday"])
-
-    start = datetime(2023, 1, 2)  # First Monday of 2023
-
-    for i in range(n_weeks):
-        dt = start + timedelta(weeks=i)
-        week_of_year = dt.isocalendar()[1]
-
-        # Seasonality (peak in Q4)
-        season = 1 + 0.3 * math.sin(2 * math.pi * (week_of_year - 13) / 52)
-
-        # Channel spends with some correlation
-        google = max(0, random.gauss(5000, 1500) * season)
-        facebook = max(0, random.gauss(3000, 1000) * season)
-        tv = max(0, random.gauss(8000, 3000)) if week_of_year % 4 == 0 else max(0, random.gauss(2000, 800))
-        email_spend = max(0, random.gauss(500, 200))
-
-        # Holiday flag (Black Friday week, Christmas, etc.)
-        is_holiday = 1 if week_of_year in [47, 48, 51, 52, 1] else 0
-
-        # Revenue = base + channel effects + noise
-        base = 50000 * season
-        google_effect = google * 2.5 * (1 - google / 20000)  # Diminishing returns
-        facebook_effect = facebook * 1.8 * (1 - facebook / 15000)
-        tv_effect = tv * 1.2 * (1 - tv / 30000)
-        email_effect = email_spend * 3.0
-        holiday_effect = 15000 * is_holiday
-
-        revenue = base + google_effect + facebook_effect + tv_effect + email_effect + holiday_effect
-        revenue += random.gauss(0, 3000)  # Noise
-        revenue = max(0, revenue)
-
-        writer.writerow([
-            dt.strftime("%Y-%m-%d"),
-            round(revenue, 2),
-            round(google, 2),
-            round(facebook, 2),
-            round(tv, 2),
-            round(email_spend, 2),
-            is_holiday,
-        ])
 
-    return buf.getvalue()
+def sample_csv_path(n_weeks: int = 104) -> Path:
+    """Return an on-disk copy of the sample CSV, generating it only on a cache miss."""
+    key = hashlib.blake2b(repr((n_weeks, SAMPLE_CSV_VERSION)).encode(), digest_size=16).hexdigest()
+    path = SAMPLE_CSV_CACHE_DIR / f"seed_{key}.csv"
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(generate_sample_csv(n_weeks))
+        os.replace(tmp, path)  # atomic, so a concurrent run never sees a partial file
+    return path
+
 
+FAST_HASH_ROUNDS = 4
 
-def seed():
+
+def seed(fast_hash: bool = False):
     settings = get_settings()
+    hash_rounds = FAST_HASH_ROUNDS if fast_hash else None
     engine = create_engine(settings.database_url_sync)
 
-    with Session(engine) as db:
-        # Check if demo user already exists
-        existing = db.execute(select(User).where(User.email == "demo@mixmodel.app")).scalar_one_or_none()
-        if existing:
-            print("Demo user already exists. Skipping seed.")
-            return
+    insert = sqlite_insert if engine.dialect.name == "sqlite" else pg_insert
 
+    with Session(engine, expire_on_commit=False) as db:
         # Create workspace
-        workspace_id = str(uuid.uuid4())
+        workspace_id = new_id()
         workspace = Workspace(
             id=workspace_id,
             name="Demo Marketing Team",
         )
         db.add(workspace)
         db.flush()
-        print(f"Created workspace: {workspace.name} ({workspace_id})")
 
-        # Create demo user
-        user_id = str(uuid.uuid4())
-        user = User(
-            id=user_id,
-            email="demo@mixmodel.app",
-            hashed_password=hash_password("demo123"),
-            full_name="Demo User",
-            role="admin",
-            workspace_id=workspace_id,
-        )
-        db.add(user)
-        db.flush()
-        print(f"Created user: {user.email} (password: demo123)")
+        # Create demo user, unless it already exists. The conflict check happens
+        # in the INSERT itself, so concurrent seed runs can't both create it.
+        user_id = db.execute(
+            insert(User)
+            .values(
+                id=new_id(),
+                email="demo@mixmodel.app",
+                hashed_password=hash_password("demo123", rounds=hash_rounds),
+                full_name="Demo User",
+                role="admin",
+                workspace_id=workspace_id,
+            )
+            .on_conflict_do_nothing(index_elements=["email"])
+            .returning(User.id)
+        ).scalar_one_or_none()
+        if user_id is None:
+            db.rollback()
+            print("Demo user already exists. Skipping seed.")
+            return
 
         # Create admin user (David)
-        david_id = str(uuid.uuid4())
+        david_id = new_id()
         david = User(
             id=david_id,
             email="david.geborek@gmail.com",
-            hashed_password=hash_password("Skillsmp123"),
+            hashed_password=hash_password("Skillsmp123", rounds=hash_rounds),
             full_name="David Geborek",
             role="admin",
             workspace_id=workspace_id,
         )
-        db.add(david)
-        db.flush()
-        print(f"Created user: {david.email} (admin)")
 
-        # Generate and upload CSV
-        csv_content = generate_sample_csv()
-        dataset_id = str(uuid.uuid4())
+        # Generate (or reuse the cached) CSV and upload it
+        dataset_id = new_id()
         s3_key = f"datasets/{workspace_id}/{dataset_id}/demo_marketing_data.csv"
 
         try:
             from app.services.storage import StorageService
 
             storage = StorageService()
-            storage.upload_file(s3_key, csv_content.encode(), "text/csv")
-            print(f"Uploaded CSV to S3: {s3_key}")
+            with open(sample_csv_path(), "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as csv_map:
+                storage.upload_fileobj(s3_key, csv_map, "text/csv")
+            print(f"Stored CSV ({settings.storage_backend}): {s3_key}")
         except Exception as e:
-            print(f"Warning: Could not upload to S3 ({e}). Dataset record created without S3 file.")
+            print(f"Warning: Could not store CSV ({e}). Dataset record created without a file.")
 
         # Create dataset record
         dataset = Dataset(
@@ -157,11 +186,19 @@ def seed():
                 "control_columns": ["is_holiday"],
             },
         )
-        db.add(dataset)
+        db.add_all([david, dataset])
         db.commit()
-        print(f"Created dataset: {dataset.filename} ({dataset.id})")
+        print(f"Created workspace: {workspace.name} ({workspace_id})")
+        print("Created user: demo@mixmodel.app (password: demo123)")
+        print(f"Created user: {david.email} (admin)")
+        print(f"Created dataset: {dataset.filename} ({dataset_id})")
         print("\nSeed complete! Login with demo@mixmodel.app / demo123")
 
 
 if __name__ == "__main__":
-    seed()
+    parser = argparse.ArgumentParser(description="Seed demo data.")
+    parser.add_argument(
+        "--fast-hash", action="store_true", help="hash demo passwords at the minimum bcrypt cost (local dev only)"
+    )
+    args = parser.parse_args()
+    seed(fast_hash=args.fast_hash)
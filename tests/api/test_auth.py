@@ -1,7 +1,10 @@
 """Tests for authentication endpoints: register, login, refresh, me."""
 
+import pytest
 from httpx import AsyncClient
 
+pytestmark = pytest.mark.xdist_group("auth")
+
 
 # ---------------------------------------------------------------------------
 # Register
@@ -150,16 +153,8 @@ class TestLogin:
 class TestRefresh:
     """POST /api/auth/refresh"""
 
-    async def test_refresh_success(self, client: AsyncClient, registered_user):
-        # First login to get a refresh token
-        login_resp = await client.post(
-            "/api/auth/login",
-            json={
-                "email": registered_user["email"],
-                "password": registered_user["password"],
-            },
-        )
-        refresh_token = login_resp.json()["refresh_token"]
+    async def test_refresh_success(self, client: AsyncClient, registered_user, token_factory):
+        refresh_token = token_factory(registered_user)["refresh_token"]
 
         resp = await client.post(
             "/api/auth/refresh",
@@ -178,17 +173,10 @@ class TestRefresh:
         assert resp.status_code == 401
 
     async def test_refresh_with_access_token_rejected(
-        self, client: AsyncClient, registered_user
+        self, client: AsyncClient, registered_user, token_factory
     ):
         """Using an access token as a refresh token should fail."""
-        login_resp = await client.post(
-            "/api/auth/login",
-            json={
-                "email": registered_user["email"],
-                "password": registered_user["password"],
-            },
-        )
-        access_token = login_resp.json()["access_token"]
+        access_token = token_factory(registered_user)["access_token"]
 
         resp = await client.post(
             "/api/auth/refresh",
@@ -216,10 +204,6 @@ class TestMe:
         assert data["role"] == "admin"
         assert data["workspace_id"] == registered_user["workspace_id"]
 
-    async def test_me_unauthenticated(self, client: AsyncClient):
-        resp = await client.get("/api/auth/me")
-        assert resp.status_code in (401, 403)
-
     async def test_me_invalid_token(self, client: AsyncClient):
         resp = await client.get(
             "/api/auth/me",
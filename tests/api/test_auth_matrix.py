@@ -0,0 +1,31 @@
+"""Every protected endpoint must reject requests without credentials."""
+
+import pytest
+from httpx import AsyncClient
+
+pytestmark = pytest.mark.xdist_group("auth_matrix")
+
+
+PROTECTED_ENDPOINTS = [
+    ("GET", "/api/auth/me", None),
+    ("GET", "/api/models", None),
+    ("GET", "/api/models/some-id", None),
+    ("POST", "/api/models/run", {"dataset_id": "some-id"}),
+    ("DELETE", "/api/models/some-id", None),
+    ("GET", "/api/models/some-id/results", None),
+    ("GET", "/api/datasets", None),
+    ("GET", "/api/datasets/some-id", None),
+    ("DELETE", "/api/datasets/some-id", None),
+    ("GET", "/api/datasets/some-id/preview", None),
+    ("GET", "/api/workspace", None),
+    ("PUT", "/api/workspace", {"name": "New Name"}),
+    ("GET", "/api/workspace/members", None),
+]
+
+
+@pytest.mark.parametrize("method,url,body", PROTECTED_ENDPOINTS)
+async def test_unauthenticated_request_rejected(
+    client: AsyncClient, method: str, url: str, body: dict | None
+):
+    resp = await client.request(method, url, json=body)
+    assert resp.status_code in (401, 403)
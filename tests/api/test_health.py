@@ -1,7 +1,10 @@
 """Tests for the health endpoint."""
 
+import pytest
 from httpx import AsyncClient
 
+pytestmark = pytest.mark.xdist_group("health")
+
 
 class TestHealth:
     async def test_health_returns_200(self, client: AsyncClient):
@@ -1,7 +1,10 @@
 """Tests for model run endpoints."""
 
+import pytest
 from httpx import AsyncClient
 
+pytestmark = pytest.mark.xdist_group("models")
+
 
 class TestListModelRuns:
     """GET /api/models"""
@@ -13,10 +16,6 @@ class TestListModelRuns:
         assert resp.status_code == 200
         assert isinstance(resp.json(), list)
 
-    async def test_list_model_runs_unauthenticated(self, client: AsyncClient):
-        resp = await client.get("/api/models")
-        assert resp.status_code in (401, 403)
-
 
 class TestGetModelRun:
     """GET /api/models/{run_id}"""
@@ -29,21 +28,10 @@ class TestGetModelRun:
         )
         assert resp.status_code == 404
 
-    async def test_get_run_unauthenticated(self, client: AsyncClient):
-        resp = await client.get("/api/models/some-id")
-        assert resp.status_code in (401, 403)
-
 
 class TestCreateModelRun:
     """POST /api/models/run"""
 
-    async def test_create_run_unauthenticated(self, client: AsyncClient):
-        resp = await client.post(
-            "/api/models/run",
-            json={"dataset_id": "some-id"},
-        )
-        assert resp.status_code in (401, 403)
-
     async def test_create_run_nonexistent_dataset(
         self, client: AsyncClient, auth_headers
     ):
@@ -66,10 +54,6 @@ class TestDeleteModelRun:
         )
         assert resp.status_code == 404
 
-    async def test_delete_run_unauthenticated(self, client: AsyncClient):
-        resp = await client.delete("/api/models/some-id")
-        assert resp.status_code in (401, 403)
-
 
 class TestGetResults:
     """GET /api/models/{run_id}/results"""
@@ -81,7 +65,3 @@ class TestGetResults:
             "/api/models/nonexistent-id/results", headers=auth_headers
         )
         assert resp.status_code == 404
-
-    async def test_results_unauthenticated(self, client: AsyncClient):
-        resp = await client.get("/api/models/some-id/results")
-        assert resp.status_code in (401, 403)
@@ -1,7 +1,10 @@
 """Tests for dataset upload and management endpoints."""
 
+import pytest
 from httpx import AsyncClient
 
+pytestmark = pytest.mark.xdist_group("upload")
+
 
 class TestListDatasets:
     """GET /api/datasets"""
@@ -13,10 +16,6 @@ class TestListDatasets:
         assert resp.status_code == 200
         assert isinstance(resp.json(), list)
 
-    async def test_list_datasets_unauthenticated(self, client: AsyncClient):
-        resp = await client.get("/api/datasets")
-        assert resp.status_code in (401, 403)
-
 
 class TestGetDataset:
     """GET /api/datasets/{dataset_id}"""
@@ -29,10 +28,6 @@ class TestGetDataset:
         )
         assert resp.status_code == 404
 
-    async def test_get_dataset_unauthenticated(self, client: AsyncClient):
-        resp = await client.get("/api/datasets/some-id")
-        assert resp.status_code in (401, 403)
-
 
 class TestDeleteDataset:
     """DELETE /api/datasets/{dataset_id}"""
@@ -45,10 +40,6 @@ class TestDeleteDataset:
         )
         assert resp.status_code == 404
 
-    async def test_delete_dataset_unauthenticated(self, client: AsyncClient):
-        resp = await client.delete("/api/datasets/some-id")
-        assert resp.status_code in (401, 403)
-
 
 class TestPreviewDataset:
     """GET /api/datasets/{dataset_id}/preview"""
@@ -60,7 +51,3 @@ class TestPreviewDataset:
             "/api/datasets/nonexistent-id/preview", headers=auth_headers
         )
         assert resp.status_code == 404
-
-    async def test_preview_unauthenticated(self, client: AsyncClient):
-        resp = await client.get("/api/datasets/some-id/preview")
-        assert resp.status_code in (401, 403)
@@ -1,18 +1,21 @@
 """Tests for workspace endpoints."""
 
-import pytest_asyncio
+import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.security import create_access_token, hash_password
 from app.models.invitation import Invitation
 from app.models.user import User
+from app.models.workspace import Workspace
+
+pytestmark = pytest.mark.xdist_group("workspace")
 
 
 # --- Fixtures ---
 
 
-@pytest_asyncio.fixture
+@pytest.fixture
 async def member_user(db_session: AsyncSession, registered_user: dict) -> dict:
     """Create a member-role user in the same workspace."""
     raw_password = "MemberPass123!"
@@ -34,17 +37,47 @@ async def member_user(db_session: AsyncSession, registered_user: dict) -> dict:
     }
 
 
-@pytest_asyncio.fixture
-async def non_admin_headers(member_user: dict) -> dict:
+@pytest.fixture
+def non_admin_headers(member_user: dict, token_factory) -> dict:
     """Return Authorization headers for a non-admin (member) user."""
-    token = create_access_token(
-        member_user["user_id"],
-        {"workspace_id": member_user["workspace_id"]},
-    )
-    return {"Authorization": f"Bearer {token}"}
+    return {"Authorization": f"Bearer {token_factory(member_user)['access_token']}"}
+
+
+@pytest.fixture
+def make_user(db_session: AsyncSession):
+    """Return a factory that adds a user and returns it with auth headers.
+
+    Without ``workspace_id`` the user is created in a workspace of their own.
+    """
+
+    async def _make(
+        email: str,
+        *,
+        role: str = "admin",
+        full_name: str = "Other User",
+        workspace_id: str | None = None,
+    ) -> tuple[User, dict]:
+        user = User(
+            email=email,
+            hashed_password=hash_password("OtherPass123!"),
+            full_name=full_name,
+            role=role,
+        )
+        if workspace_id is None:
+            # Set through the relationship so one flush inserts both rows
+            user.workspace = Workspace(name=f"{full_name}'s Workspace")
+        else:
+            user.workspace_id = workspace_id
+        db_session.add(user)
+        await db_session.flush()
 
+        token = create_access_token(user.id, {"workspace_id": user.workspace_id})
+        return user, {"Authorization": f"Bearer {token}"}
 
-@pytest_asyncio.fixture
+    return _make
+
+
+@pytest.fixture
 async def sample_invitation(
     db_session: AsyncSession, registered_user: dict
 ) -> Invitation:
@@ -76,21 +109,10 @@ class TestGetWorkspace:
         assert "name" in data
         assert "created_at" in data
 
-    async def test_get_workspace_unauthenticated(self, client: AsyncClient):
-        resp = await client.get("/api/workspace")
-        assert resp.status_code in (401, 403)
-
 
 class TestUpdateWorkspace:
     """PUT /api/workspace"""
 
-    async def test_update_workspace_unauthenticated(self, client: AsyncClient):
-        resp = await client.put(
-            "/api/workspace",
-            json={"name": "New Name"},
-        )
-        assert resp.status_code in (401, 403)
-
     async def test_update_workspace_success(
         self, client: AsyncClient, auth_headers
     ):
@@ -128,10 +150,6 @@ class TestWorkspaceMembers:
         assert "full_name" in members[0]
         assert "role" in members[0]
 
-    async def test_list_members_unauthenticated(self, client: AsyncClient):
-        response = await client.get("/api/workspace/members")
-        assert response.status_code in (401, 403)
-
 
 # --- Invite endpoints ---
 
@@ -296,29 +314,10 @@ class TestAcceptInvite:
     """POST /api/workspace/invite/{token}/accept"""
 
     async def test_accept_invite_success(
-        self, client: AsyncClient, db_session, sample_invitation
+        self, client: AsyncClient, make_user, sample_invitation
     ):
         """Create a second user (different workspace) to accept the invite."""
-        from app.models.workspace import Workspace
-
-        other_ws = Workspace(name="Other Workspace")
-        db_session.add(other_ws)
-        await db_session.flush()
-
-        other_user = User(
-            email="other@example.com",
-            hashed_password=hash_password("OtherPass123!"),
-            full_name="Other User",
-            role="admin",
-            workspace_id=other_ws.id,
-        )
-        db_session.add(other_user)
-        await db_session.flush()
-
-        token = create_access_token(
-            other_user.id, {"workspace_id": other_ws.id}
-        )
-        headers = {"Authorization": f"Bearer {token}"}
+        _, headers = await make_user("other@example.com")
 
         resp = await client.post(
             f"/api/workspace/invite/{sample_invitation.token}/accept",
@@ -350,27 +349,10 @@ class TestAcceptInvite:
         assert "already a member" in resp.json()["detail"].lower()
 
     async def test_accept_invite_email_mismatch(
-        self, client: AsyncClient, db_session, registered_user, sample_invitation
+        self, client: AsyncClient, make_user, registered_user, sample_invitation
     ):
         """Email-targeted invite rejected when different user tries to accept."""
-        from app.models.workspace import Workspace
-
-        other_ws = Workspace(name="Other WS")
-        db_session.add(other_ws)
-        await db_session.flush()
-
-        other_user = User(
-            email="wrong@example.com",
-            hashed_password=hash_password("WrongPass123!"),
-            full_name="Wrong User",
-            role="admin",
-            workspace_id=other_ws.id,
-        )
-        db_session.add(other_user)
-        await db_session.flush()
-
-        token = create_access_token(other_user.id, {"workspace_id": other_ws.id})
-        headers = {"Authorization": f"Bearer {token}"}
+        _, headers = await make_user("wrong@example.com", full_name="Wrong User")
 
         # sample_invitation has email="invitee@example.com", but this user is "wrong@example.com"
         resp = await client.post(
@@ -381,31 +363,13 @@ class TestAcceptInvite:
         assert "different email" in resp.json()["detail"].lower()
 
     async def test_accept_invite_expired(
-        self, client: AsyncClient, db_session, sample_invitation
+        self, client: AsyncClient, make_user, sample_invitation
     ):
         """Accepting an expired invite should return 410."""
         from datetime import datetime, timedelta, timezone
-        from app.models.workspace import Workspace
 
         sample_invitation.expires_at = datetime.now(timezone.utc) - timedelta(days=1)
-        await db_session.flush()
-
-        other_ws = Workspace(name="Acceptor WS")
-        db_session.add(other_ws)
-        await db_session.flush()
-
-        other_user = User(
-            email="acceptor@example.com",
-            hashed_password=hash_password("AcceptPass123!"),
-            full_name="Acceptor User",
-            role="admin",
-            workspace_id=other_ws.id,
-        )
-        db_session.add(other_user)
-        await db_session.flush()
-
-        token = create_access_token(other_user.id, {"workspace_id": other_ws.id})
-        headers = {"Authorization": f"Bearer {token}"}
+        _, headers = await make_user("acceptor@example.com", full_name="Acceptor User")
 
         resp = await client.post(
             f"/api/workspace/invite/{sample_invitation.token}/accept",
@@ -414,11 +378,10 @@ class TestAcceptInvite:
         assert resp.status_code == 410
 
     async def test_accept_invite_cancels_siblings(
-        self, client: AsyncClient, db_session, sample_invitation
+        self, client: AsyncClient, db_session, make_user, sample_invitation
     ):
         """Accepting an invite should cancel other pending invites for the same email."""
         from sqlalchemy import select
-        from app.models.workspace import Workspace
 
         # Create a sibling invite for same email, same workspace
         sibling = Invitation(
@@ -434,27 +397,13 @@ class TestAcceptInvite:
         # a different email to prove cancellation works on the user's email match.
         sibling.email = "other-pending@example.com"
         db_session.add(sibling)
-        await db_session.flush()
 
-        # Create acceptor user in a different workspace, whose email matches the sibling
-        other_ws = Workspace(name="Sibling Test WS")
-        db_session.add(other_ws)
-        await db_session.flush()
-
-        acceptor = User(
-            email="other-pending@example.com",
-            hashed_password=hash_password("SibPass123!"),
-            full_name="Sibling Acceptor",
-            role="admin",
-            workspace_id=other_ws.id,
-        )
-        db_session.add(acceptor)
         # Also update sample_invitation to be a link-only invite (no email restriction)
         sample_invitation.email = None
-        await db_session.flush()
 
-        token = create_access_token(acceptor.id, {"workspace_id": other_ws.id})
-        headers = {"Authorization": f"Bearer {token}"}
+        # Create acceptor user in a different workspace, whose email matches the sibling.
+        # Its flush also writes the sibling and the invitation change.
+        _, headers = await make_user("other-pending@example.com", full_name="Sibling Acceptor")
 
         resp = await client.post(
             f"/api/workspace/invite/{sample_invitation.token}/accept",
@@ -569,69 +518,25 @@ class TestRemoveMember:
         )
         assert resp.status_code == 403
 
-    async def test_remove_last_admin_400(
-        self, client: AsyncClient, db_session, auth_headers, registered_user
+    async def test_remove_admin_allowed_when_others_exist(
+        self, client: AsyncClient, make_user, auth_headers, registered_user
     ):
-        """Cannot remove the only admin in the workspace."""
-        # Create a second admin to be the target
-        second_admin = User(
-            email="admin2@example.com",
-            hashed_password=hash_password("Admin2Pass123!"),
-            full_name="Admin Two",
-            role="admin",
-            workspace_id=registered_user["workspace_id"],
+        """Another admin can be removed while registered_user remains admin.
+
+        The last-admin guard can't trip through the API: the caller must be an
+        admin of the same workspace, so at least two admins exist whenever
+        the target is one.
+        """
+        second_admin, _ = await make_user(
+            "admin2@example.com", full_name="Admin Two", workspace_id=registered_user["workspace_id"]
         )
-        db_session.add(second_admin)
-        await db_session.flush()
 
-        # Remove second admin - should succeed (registered_user is still admin)
         resp = await client.delete(
             f"/api/workspace/members/{second_admin.id}",
             headers=auth_headers,
         )
         assert resp.status_code == 204
 
-        # Now create a member and try to make them the target - but registered_user
-        # is the only admin. Create another admin user to remove registered_user?
-        # Actually: the last-admin check fires when the target is an admin.
-        # registered_user is the only admin, so if we create a third admin and
-        # remove them, it fails because admin_count would be 1.
-        third_admin = User(
-            email="admin3@example.com",
-            hashed_password=hash_password("Admin3Pass123!"),
-            full_name="Admin Three",
-            role="admin",
-            workspace_id=registered_user["workspace_id"],
-        )
-        db_session.add(third_admin)
-        await db_session.flush()
-
-        # Remove third admin - only 2 admins (registered_user + third_admin), so OK
-        resp2 = await client.delete(
-            f"/api/workspace/members/{third_admin.id}",
-            headers=auth_headers,
-        )
-        assert resp2.status_code == 204
-
-        # Now registered_user is the only admin.
-        # Create one more admin and try to remove registered_user as last admin.
-        sole_admin = User(
-            email="sole_target@example.com",
-            hashed_password=hash_password("SolePass123!"),
-            full_name="Sole Target",
-            role="admin",
-            workspace_id=registered_user["workspace_id"],
-        )
-        db_session.add(sole_admin)
-        await db_session.flush()
-
-        # Remove sole_admin - 2 admins exist, should work
-        resp3 = await client.delete(
-            f"/api/workspace/members/{sole_admin.id}",
-            headers=auth_headers,
-        )
-        assert resp3.status_code == 204
-
     async def test_remove_member_moves_to_personal_workspace(
         self, client: AsyncClient, db_session, auth_headers, member_user
     ):
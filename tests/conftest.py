@@ -4,22 +4,26 @@ Uses SQLite in-memory for unit/API tests (no external DB required).
 """
 
 import os
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Callable
 
+import pytest
 import pytest_asyncio
-from httpx import AsyncClient, ASGITransport
-from sqlalchemy import JSON, text
-from sqlalchemy.dialects.postgresql import JSONB
+from httpx import ASGITransport, AsyncClient
+from passlib.context import CryptContext
+from sqlalchemy import delete, event
 from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
     AsyncSession,
-    async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import StaticPool
 
 # Override settings BEFORE importing app modules so the in-memory SQLite
-# database is used instead of PostgreSQL.
-os.environ["DATABASE_URL"] = "sqlite+aiosqlite:///file::memory:?cache=shared&uri=true"
-os.environ["DATABASE_URL_SYNC"] = "sqlite:///file::memory:?cache=shared&uri=true"
+# database is used instead of PostgreSQL. Each pytest-xdist worker is its own
+# process and so gets its own database; test modules are pinned to a worker
+# with xdist_group marks (run with `-n auto --dist loadgroup`).
+os.environ["DATABASE_URL"] = "sqlite+aiosqlite://"
+os.environ["DATABASE_URL_SYNC"] = "sqlite://"
 os.environ["JWT_SECRET_KEY"] = "test-secret-key-not-for-production"
 os.environ["APP_ENV"] = "test"
 os.environ["APP_DEBUG"] = "false"
@@ -30,103 +34,189 @@ from app.core.config import get_settings  # noqa: E402
 
 get_settings.cache_clear()
 
+from app.core import security  # noqa: E402
 from app.core.database import Base, get_db  # noqa: E402
-from app.core.security import create_access_token, hash_password  # noqa: E402
+from app.core.ids import new_id  # noqa: E402
+from app.core.security import create_access_token, create_refresh_token, hash_password  # noqa: E402
 from app.main import app  # noqa: E402
 from app.models import Dataset, Invitation, ModelRun, User, Workspace  # noqa: E402, F401
 
-# Map PostgreSQL JSONB -> generic JSON for SQLite compatibility in tests.
-# This must happen before create_all() so the DDL renders correctly.
-for table in Base.metadata.tables.values():
-    for column in table.columns:
-        if isinstance(column.type, JSONB):
-            column.type = JSON()
-
-# Async SQLite engine for tests
+# Async SQLite engine for tests. StaticPool hands out one connection, so the
+# in-memory database lives for the whole session.
 TEST_ENGINE = create_async_engine(
-    "sqlite+aiosqlite:///file::memory:?cache=shared&uri=true",
+    "sqlite+aiosqlite://",
     echo=False,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
 )
-TestSessionLocal = async_sessionmaker(
-    TEST_ENGINE, class_=AsyncSession, expire_on_commit=False
-)
 
 
-@pytest_asyncio.fixture(scope="session", autouse=True, loop_scope="session")
-async def setup_database():
-    """Create all tables once per test session."""
-    async with TEST_ENGINE.begin() as conn:
+# pysqlite's implicit transaction handling breaks SAVEPOINTs; let SQLAlchemy
+# emit BEGIN itself so the per-test rollback below works. Nothing outlives
+# the process, so journaling and syncs are skipped too.
+@event.listens_for(TEST_ENGINE.sync_engine, "connect")
+def _configure_sqlite(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.close()
+
+
+@event.listens_for(TEST_ENGINE.sync_engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
+
+
+def pytest_collection_modifyitems(items):
+    """Run every async test on the session event loop.
+
+    The shared connection and HTTP client are bound to the loop they were
+    created on, so tests can't each get a fresh loop.
+    """
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_password_hashing():
+    """Swap bcrypt for unsalted SHA-256 for the whole session.
+
+    Auth tests check that a password verifies, not KDF strength, and bcrypt
+    dominates fixture setup even at the minimum cost.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(security, "pwd_context", CryptContext(schemes=["hex_sha256"]))
+        yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+async def setup_database() -> AsyncGenerator[AsyncConnection, None]:
+    """Create all tables once per test session and hold the connection tests run on.
+
+    TEST_ENGINE uses a StaticPool, so every session in the test run shares
+    this one connection and the in-memory database lives as long as it does.
+    """
+    async with TEST_ENGINE.connect() as conn:
         await conn.run_sync(Base.metadata.create_all)
-    yield
-    async with TEST_ENGINE.begin() as conn:
+        await conn.commit()
+        yield conn
         await conn.run_sync(Base.metadata.drop_all)
+        await conn.commit()
+
 
+@pytest.fixture
+async def db_session(setup_database: AsyncConnection) -> AsyncGenerator[AsyncSession, None]:
+    """Provide a database session whose work is rolled back after each test.
 
-@pytest_asyncio.fixture
-async def db_session() -> AsyncGenerator[AsyncSession, None]:
-    """Provide a database session that cleans up after each test."""
-    async with TestSessionLocal() as session:
+    The session joins an outer transaction on the shared connection; commits
+    made during the test only release a SAVEPOINT.
+    """
+    trans = await setup_database.begin()
+    session = AsyncSession(
+        bind=setup_database,
+        join_transaction_mode="create_savepoint",
+        expire_on_commit=False,
+    )
+    try:
         yield session
-        # Roll back any uncommitted changes
-        await session.rollback()
-        # Clean up all tables for isolation between tests
-        for table in reversed(Base.metadata.sorted_tables):
-            await session.execute(text(f"DELETE FROM {table.name}"))
-        await session.commit()
+    finally:
+        await session.close()
+        await trans.rollback()
 
 
-@pytest_asyncio.fixture
-async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
-    """Async HTTP client that uses the test database session."""
+@pytest.fixture(scope="session")
+async def http_client() -> AsyncGenerator[AsyncClient, None]:
+    """One ASGI client for the whole session."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.fixture
+async def client(http_client: AsyncClient, db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
+    """Async HTTP client that uses the test database session.
+
+    The override flushes where get_db would commit, so a request's writes
+    stay inside the test's outer transaction.
+    """
 
     async def _override_get_db():
         try:
             yield db_session
-            await db_session.commit()
+            await db_session.flush()
         except Exception:
             await db_session.rollback()
             raise
 
     app.dependency_overrides[get_db] = _override_get_db
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as ac:
-        yield ac
+    yield http_client
     app.dependency_overrides.clear()
+    http_client.cookies.clear()
+
+
+@pytest.fixture(scope="module")
+async def registered_user(setup_database: AsyncConnection) -> AsyncGenerator[dict, None]:
+    """Create a registered user once per test module and return user info + raw password.
+
+    The rows are committed on the shared connection, outside the per-test
+    transactions, so each test sees them and any changes a test makes to
+    them are rolled back with the rest of its work.
+    """
+    async with AsyncSession(bind=setup_database, expire_on_commit=False) as session:
+        workspace = Workspace(id=new_id(), name="Test Workspace")
+        session.add(workspace)
+        await session.flush()
+
+        raw_password = "TestPassword123!"
+        user = User(
+            id=new_id(),
+            email="testuser@example.com",
+            hashed_password=hash_password(raw_password),
+            full_name="Test User",
+            role="admin",
+            workspace_id=workspace.id,
+        )
+        session.add(user)
+        await session.commit()
+
+        yield {
+            "user": user,
+            "workspace": workspace,
+            "email": user.email,
+            "password": raw_password,
+            "user_id": user.id,
+            "workspace_id": workspace.id,
+        }
+
+        await session.execute(delete(User).where(User.id == user.id))
+        await session.execute(delete(Workspace).where(Workspace.id == workspace.id))
+        await session.commit()
 
 
-@pytest_asyncio.fixture
-async def registered_user(db_session: AsyncSession) -> dict:
-    """Create a registered user and return user info + raw password."""
-    workspace = Workspace(name="Test Workspace")
-    db_session.add(workspace)
-    await db_session.flush()
-
-    raw_password = "TestPassword123!"
-    user = User(
-        email="testuser@example.com",
-        hashed_password=hash_password(raw_password),
-        full_name="Test User",
-        role="admin",
-        workspace_id=workspace.id,
-    )
-    db_session.add(user)
-    await db_session.flush()
+@pytest.fixture(scope="session")
+def token_factory() -> Callable[[dict], dict]:
+    """Mint access/refresh tokens for a user dict in-process, skipping the /login round trip.
 
-    return {
-        "user": user,
-        "workspace": workspace,
-        "email": user.email,
-        "password": raw_password,
-        "user_id": user.id,
-        "workspace_id": workspace.id,
-    }
+    Access tokens are signed once per (user, workspace) and reused for the
+    session. Nothing revokes them, and their 15-minute lifetime outlasts a run.
+    """
+    access_tokens: dict[tuple[str, str], str] = {}
 
+    def _make_tokens(user: dict) -> dict:
+        key = (user["user_id"], user["workspace_id"])
+        if key not in access_tokens:
+            access_tokens[key] = create_access_token(key[0], {"workspace_id": key[1]})
+        return {
+            "access_token": access_tokens[key],
+            "refresh_token": create_refresh_token(user["user_id"]),
+        }
 
-@pytest_asyncio.fixture
-async def auth_headers(registered_user: dict) -> dict:
+    return _make_tokens
+
+
+@pytest.fixture(scope="module")
+def auth_headers(registered_user: dict, token_factory) -> dict:
     """Return Authorization headers with a valid access token."""
-    token = create_access_token(
-        registered_user["user_id"],
-        {"workspace_id": registered_user["workspace_id"]},
-    )
-    return {"Authorization": f"Bearer {token}"}
+    return {"Authorization": f"Bearer {token_factory(registered_user)['access_token']}"}
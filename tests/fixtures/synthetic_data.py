@@ -4,10 +4,13 @@ The ground truth parameters allow us to verify the MMM engine
 recovers them within acceptable bounds.
 """
 
+import hashlib
 import json
 import numpy as np
 import pandas as pd
 from pathlib import Path
+from scipy.signal import lfilter
+from scipy.special import expit
 
 
 # Ground truth parameters for all scenarios
@@ -41,15 +44,33 @@ GROUND_TRUTH_52W = {
     },
 }
 
+# Holiday weeks within a year, repeated for the second year
+HOLIDAY_WEEKS = np.array([0, 13, 26, 39, 48, 49, 50, 51])
+_HOLIDAY_WEEK_INDEX = np.concatenate([HOLIDAY_WEEKS, HOLIDAY_WEEKS + 52])
+
 
 def _apply_geometric_adstock(spend: np.ndarray, alpha: float) -> np.ndarray:
-    """Apply geometric adstock transformation."""
-    n = len(spend)
-    adstocked = np.zeros(n)
-    adstocked[0] = spend[0]
-    for t in range(1, n):
-        adstocked[t] = spend[t] + alpha * adstocked[t - 1]
-    return adstocked
+    """Apply geometric adstock transformation.
+
+    The recursion y[t] = x[t] + alpha * y[t-1] is a first-order IIR filter.
+    """
+    spend = np.asarray(spend, dtype=np.float64)
+    if alpha == 0.0:
+        return spend.copy()
+    return lfilter([1.0], [1.0, -float(alpha)], spend)
+
+
+def _apply_geometric_adstock_batch(spend: np.ndarray, alphas) -> np.ndarray:
+    """Apply geometric adstock to each row of a (channels, weeks) spend matrix."""
+    spend = np.asarray(spend, dtype=np.float64)
+    return np.stack([_apply_geometric_adstock(row, a) for row, a in zip(spend, alphas)])
+
+
+def _holiday_flags(n_weeks: int) -> np.ndarray:
+    """0/1 holiday indicator over the first two years of weeks."""
+    flags = np.zeros(n_weeks)
+    flags[_HOLIDAY_WEEK_INDEX[_HOLIDAY_WEEK_INDEX < n_weeks]] = 1.0
+    return flags
 
 
 def _apply_logistic_saturation(x: np.ndarray, lam: float) -> np.ndarray:
@@ -57,7 +78,38 @@ def _apply_logistic_saturation(x: np.ndarray, lam: float) -> np.ndarray:
     x_mean = x.mean()
     if x_mean == 0:
         return np.zeros_like(x)
-    return 1.0 / (1.0 + np.exp(-lam * (x / x_mean - 1.0)))
+    z = x / x_mean
+    z -= 1.0
+    z *= lam
+    return expit(z)
+
+
+def _media_contributions(
+    spend_mat: np.ndarray, channels: dict[str, dict], base_revenue: float
+) -> np.ndarray:
+    """Revenue contribution per channel, as a (channels, weeks) matrix.
+
+    Rows of ``spend_mat`` follow the order of ``channels``.
+    """
+    adstocked = _apply_geometric_adstock_batch(
+        spend_mat, [params["alpha"] for params in channels.values()]
+    )
+    saturated = np.stack([
+        _apply_logistic_saturation(row, params["lam"])
+        for row, params in zip(adstocked, channels.values())
+    ])
+    betas = np.array([params["beta"] for params in channels.values()])
+    return base_revenue * betas[:, None] * saturated
+
+
+def _spend_frame(
+    dates: pd.DatetimeIndex, revenue: np.ndarray, spend_mat: np.ndarray, channel_names: list[str]
+) -> pd.DataFrame:
+    """Assemble week_start, revenue, then one spend column per row of ``spend_mat``."""
+    df = pd.DataFrame(spend_mat.T, columns=channel_names)
+    df.insert(0, "revenue", revenue)
+    df.insert(0, "week_start", dates)
+    return df
 
 
 def generate_synthetic_dataset(
@@ -84,30 +136,22 @@ def generate_synthetic_dataset(
 
     channel_names = list(channels.keys())[:n_channels]
 
-    # Generate spend data with log-normal distribution + seasonality
-    spend_data = {}
-    for ch in channel_names:
-        base_spend = rng.lognormal(mean=10, sigma=0.5, size=n_weeks)
-        seasonal = 1 + 0.2 * np.sin(2 * np.pi * np.arange(n_weeks) / 52)
-        spend_data[ch] = base_spend * seasonal
+    # Annual cycle shared by spend seasonality and temperature
+    season = np.sin(2 * np.pi * np.arange(n_weeks) / 52)
+    seasonal = 1 + 0.2 * season
+
+    # Generate spend data with log-normal distribution + seasonality,
+    # one row per channel
+    spend_mat = rng.lognormal(mean=10, sigma=0.5, size=(len(channel_names), n_weeks))
+    spend_mat *= seasonal
 
     # Control variables
     temperature = (
         15
-        + 10 * np.sin(2 * np.pi * np.arange(n_weeks) / 52)
+        + 10 * season
         + rng.normal(0, 2, n_weeks)
     )
-    holiday_flag = np.zeros(n_weeks)
-    holiday_weeks = [0, 13, 26, 39, 48, 49, 50, 51]
-    for w in holiday_weeks:
-        if w < n_weeks:
-            holiday_flag[w] = 1
-    # Repeat holidays for second year if 104 weeks
-    if n_weeks > 52:
-        for w in holiday_weeks:
-            week_idx = w + 52
-            if week_idx < n_weeks:
-                holiday_flag[week_idx] = 1
+    holiday_flag = _holiday_flags(n_weeks)
 
     # Base revenue
     base_revenue = 50000
@@ -115,19 +159,10 @@ def generate_synthetic_dataset(
 
     revenue = np.full(n_weeks, base_revenue, dtype=float)
 
-    # Track per-channel contributions for ground truth
-    channel_contributions = {}
-
-    for ch in channel_names:
-        params = channels[ch]
-        spend = spend_data[ch]
-
-        adstocked = _apply_geometric_adstock(spend, params["alpha"])
-        saturated = _apply_logistic_saturation(adstocked, params["lam"])
-        contribution = params["beta"] * base_revenue * saturated
-
-        channel_contributions[ch] = contribution
-        revenue += contribution
+    contributions = _media_contributions(
+        spend_mat, {ch: channels[ch] for ch in channel_names}, base_revenue
+    )
+    revenue += contributions.sum(axis=0)
 
     # Control effects
     revenue += 100 * temperature
@@ -135,21 +170,36 @@ def generate_synthetic_dataset(
     revenue += noise
 
     # Assemble DataFrame
-    df = pd.DataFrame({"week_start": dates, "revenue": revenue})
-    for ch in channel_names:
-        df[ch] = spend_data[ch]
+    df = _spend_frame(dates, revenue, spend_mat, channel_names)
     df["temperature"] = temperature
     df["holiday_flag"] = holiday_flag
 
     # Compute ground truth summaries
     total_revenue = revenue.sum()
-    total_channel_contribution = sum(c.sum() for c in channel_contributions.values())
+    contribution_totals = contributions.sum(axis=1)
+    spend_totals = spend_mat.sum(axis=1)
+    total_channel_contribution = contribution_totals.sum()
+    shares = contribution_totals / total_channel_contribution
+    roas = np.divide(
+        contribution_totals, spend_totals, out=np.zeros_like(contribution_totals), where=spend_totals > 0
+    )
     base_total = base_revenue * n_weeks
 
     ground_truth = {
         "base_revenue": base_revenue,
         "base_sales_pct": base_total / total_revenue,
-        "channels": {},
+        "channels": {
+            ch: {
+                "beta": channels[ch]["beta"],
+                "alpha": channels[ch]["alpha"],
+                "lam": channels[ch]["lam"],
+                "total_contribution": float(contribution_totals[i]),
+                "contribution_share": float(shares[i]),
+                "roas": float(roas[i]),
+                "total_spend": float(spend_totals[i]),
+            }
+            for i, ch in enumerate(channel_names)
+        },
         "controls": {
             "temperature_coeff": 100,
             "holiday_boost": 5000,
@@ -159,20 +209,6 @@ def generate_synthetic_dataset(
         "total_media_contribution": float(total_channel_contribution),
     }
 
-    for ch in channel_names:
-        params = channels[ch]
-        ch_total = channel_contributions[ch].sum()
-        total_spend = spend_data[ch].sum()
-        ground_truth["channels"][ch] = {
-            "beta": params["beta"],
-            "alpha": params["alpha"],
-            "lam": params["lam"],
-            "total_contribution": float(ch_total),
-            "contribution_share": float(ch_total / total_channel_contribution),
-            "roas": float(ch_total / total_spend) if total_spend > 0 else 0.0,
-            "total_spend": float(total_spend),
-        }
-
     return df, ground_truth
 
 
@@ -189,27 +225,18 @@ def generate_high_saturation_dataset(
         "search_spend": {"beta": 0.20, "alpha": 0.1, "lam": 0.3},
     }
 
-    spend_data = {}
-    for ch in channels:
-        # Much higher spend levels to push into saturation
-        base_spend = rng.lognormal(mean=12, sigma=0.3, size=n_weeks)
-        spend_data[ch] = base_spend
+    # Much higher spend levels to push into saturation
+    spend_mat = rng.lognormal(mean=12, sigma=0.3, size=(len(channels), n_weeks))
 
     base_revenue = 80000
     revenue = np.full(n_weeks, base_revenue, dtype=float)
     noise = rng.normal(0, 2500, n_weeks)
 
-    for ch, params in channels.items():
-        spend = spend_data[ch]
-        adstocked = _apply_geometric_adstock(spend, params["alpha"])
-        saturated = _apply_logistic_saturation(adstocked, params["lam"])
-        revenue += params["beta"] * base_revenue * saturated
+    revenue += _media_contributions(spend_mat, channels, base_revenue).sum(axis=0)
 
     revenue += noise
 
-    df = pd.DataFrame({"week_start": dates, "revenue": revenue})
-    for ch in channels:
-        df[ch] = spend_data[ch]
+    df = _spend_frame(dates, revenue, spend_mat, list(channels))
 
     ground_truth = {
         "base_revenue": base_revenue,
@@ -241,43 +268,33 @@ def generate_complex_dataset(
         "email_spend": {"beta": 0.04, "alpha": 0.05, "lam": 0.9},
     }
 
-    spend_data = {}
-    for ch in channels:
-        base_spend = rng.lognormal(mean=10, sigma=0.5, size=n_weeks)
-        seasonal = 1 + 0.3 * np.sin(2 * np.pi * np.arange(n_weeks) / 52)
-        spend_data[ch] = base_spend * seasonal
+    # Annual cycle shared by spend seasonality and temperature
+    season = np.sin(2 * np.pi * np.arange(n_weeks) / 52)
+    seasonal = 1 + 0.3 * season
+
+    spend_mat = rng.lognormal(mean=10, sigma=0.5, size=(len(channels), n_weeks))
+    spend_mat *= seasonal
 
     # Multiple controls
     temperature = (
-        15 + 12 * np.sin(2 * np.pi * np.arange(n_weeks) / 52)
+        15 + 12 * season
         + rng.normal(0, 2, n_weeks)
     )
-    holiday_flag = np.zeros(n_weeks)
-    for w in [0, 13, 26, 39, 48, 49, 50, 51]:
-        if w < n_weeks:
-            holiday_flag[w] = 1
-        if w + 52 < n_weeks:
-            holiday_flag[w + 52] = 1
+    holiday_flag = _holiday_flags(n_weeks)
     competitor_promo = rng.binomial(1, 0.15, n_weeks).astype(float)
 
     base_revenue = 60000
     revenue = np.full(n_weeks, base_revenue, dtype=float)
     noise = rng.normal(0, 3000, n_weeks)
 
-    for ch, params in channels.items():
-        spend = spend_data[ch]
-        adstocked = _apply_geometric_adstock(spend, params["alpha"])
-        saturated = _apply_logistic_saturation(adstocked, params["lam"])
-        revenue += params["beta"] * base_revenue * saturated
+    revenue += _media_contributions(spend_mat, channels, base_revenue).sum(axis=0)
 
     revenue += 120 * temperature
     revenue += 7000 * holiday_flag
     revenue -= 3000 * competitor_promo
     revenue += noise
 
-    df = pd.DataFrame({"week_start": dates, "revenue": revenue})
-    for ch in channels:
-        df[ch] = spend_data[ch]
+    df = _spend_frame(dates, revenue, spend_mat, list(channels))
     df["temperature"] = temperature
     df["holiday_flag"] = holiday_flag
     df["competitor_promo"] = competitor_promo
@@ -291,35 +308,81 @@ def generate_complex_dataset(
     return df, ground_truth
 
 
+# Records, per output file, the hash of the generator source that wrote it.
+# File mtimes are unreliable here (git checkout/clone sets them arbitrarily).
+MANIFEST_NAME = "fixtures_manifest.json"
+
+
+def _generator_hash() -> str:
+    return hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16).hexdigest()
+
+
+def _is_stale(manifest: dict, generator_hash: str, *paths: Path) -> bool:
+    """True if any output is missing or was written by a different generator version."""
+    return any(not p.exists() or manifest.get(p.name) != generator_hash for p in paths)
+
+
 if __name__ == "__main__":
+    import sys
+
     fixtures_dir = Path(__file__).parent
+    # Outputs written by the current generator are kept; pass --force to regenerate them anyway.
+    force = "--force" in sys.argv[1:]
+    manifest_path = fixtures_dir / MANIFEST_NAME
+    manifest = json.loads(manifest_path.read_text()) if manifest_path.exists() else {}
+    generator_hash = _generator_hash()
+
+    def is_stale(*paths: Path) -> bool:
+        return force or _is_stale(manifest, generator_hash, *paths)
+
+    def mark_fresh(*paths: Path) -> None:
+        for p in paths:
+            manifest[p.name] = generator_hash
 
     # 104-week standard dataset
-    df_104, truth_104 = generate_synthetic_dataset(n_weeks=104)
-    df_104.to_csv(fixtures_dir / "synthetic_104w.csv", index=False)
-    with open(fixtures_dir / "ground_truth_104w.json", "w") as f:
-        json.dump(truth_104, f, indent=2)
-    print(f"Generated synthetic_104w.csv: {len(df_104)} rows, {len(truth_104['channels'])} channels")
+    csv_104 = fixtures_dir / "synthetic_104w.csv"
+    json_104 = fixtures_dir / "ground_truth_104w.json"
+    if is_stale(csv_104, json_104):
+        df_104, truth_104 = generate_synthetic_dataset(n_weeks=104)
+        df_104.to_csv(csv_104, index=False)
+        with open(json_104, "w") as f:
+            json.dump(truth_104, f, indent=2)
+        mark_fresh(csv_104, json_104)
+        print(f"Generated synthetic_104w.csv: {len(df_104)} rows, {len(truth_104['channels'])} channels")
+    else:
+        with open(json_104) as f:
+            truth_104 = json.load(f)
+        print("synthetic_104w.csv is up to date")
 
     # 52-week quick-test dataset
-    df_52, truth_52 = generate_synthetic_dataset(n_weeks=52)
-    df_52.to_csv(fixtures_dir / "synthetic_52w.csv", index=False)
-    with open(fixtures_dir / "ground_truth_52w.json", "w") as f:
-        json.dump(truth_52, f, indent=2)
-    print(f"Generated synthetic_52w.csv: {len(df_52)} rows, {len(truth_52['channels'])} channels")
+    csv_52 = fixtures_dir / "synthetic_52w.csv"
+    json_52 = fixtures_dir / "ground_truth_52w.json"
+    if is_stale(csv_52, json_52):
+        df_52, truth_52 = generate_synthetic_dataset(n_weeks=52)
+        df_52.to_csv(csv_52, index=False)
+        with open(json_52, "w") as f:
+            json.dump(truth_52, f, indent=2)
+        mark_fresh(csv_52, json_52)
+        print(f"Generated synthetic_52w.csv: {len(df_52)} rows, {len(truth_52['channels'])} channels")
+    else:
+        print("synthetic_52w.csv is up to date")
 
     # Validation scenario datasets
-    df_hs, _ = generate_high_saturation_dataset()
-    df_hs.to_csv(fixtures_dir / "synthetic_high_saturation.csv", index=False)
-    print(f"Generated synthetic_high_saturation.csv: {len(df_hs)} rows")
-
-    df_ld, _ = generate_low_data_dataset()
-    df_ld.to_csv(fixtures_dir / "synthetic_low_data.csv", index=False)
-    print(f"Generated synthetic_low_data.csv: {len(df_ld)} rows")
-
-    df_cx, _ = generate_complex_dataset()
-    df_cx.to_csv(fixtures_dir / "synthetic_complex.csv", index=False)
-    print(f"Generated synthetic_complex.csv: {len(df_cx)} rows")
+    for name, generate in [
+        ("synthetic_high_saturation.csv", generate_high_saturation_dataset),
+        ("synthetic_low_data.csv", generate_low_data_dataset),
+        ("synthetic_complex.csv", generate_complex_dataset),
+    ]:
+        path = fixtures_dir / name
+        if is_stale(path):
+            df, _ = generate()
+            df.to_csv(path, index=False)
+            mark_fresh(path)
+            print(f"Generated {name}: {len(df)} rows")
+        else:
+            print(f"{name} is up to date")
+
+    manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n")
 
     print("\nGround truth (104w):")
     for ch, params in truth_104["channels"].items():
@@ -8,21 +8,29 @@ tested for auth enforcement only.
 import pytest
 from httpx import AsyncClient
 
+pytestmark = pytest.mark.xdist_group("integration")
+
+# Registration payloads (read-only)
+E2E_USER = {
+    "email": "e2e@example.com",
+    "password": "E2EPassword123!",
+    "full_name": "E2E User",
+    "workspace_name": "E2E Workspace",
+}
+USER_B = {
+    "email": "user_b@iso.com",
+    "password": "PassB123!",
+    "full_name": "User B",
+    "workspace_name": "Workspace B",
+}
+
 
 class TestFullUserFlow:
     """E2E: register, login, access workspace, list datasets."""
 
     async def test_register_then_access_workspace(self, client: AsyncClient):
         # Step 1: Register a new user
-        register_resp = await client.post(
-            "/api/auth/register",
-            json={
-                "email": "e2e@example.com",
-                "password": "E2EPassword123!",
-                "full_name": "E2E User",
-                "workspace_name": "E2E Workspace",
-            },
-        )
+        register_resp = await client.post("/api/auth/register", json=E2E_USER)
         assert register_resp.status_code == 201
         tokens = register_resp.json()
         headers = {"Authorization": f"Bearer {tokens['access_token']}"}
@@ -31,22 +39,27 @@ class TestFullUserFlow:
         me_resp = await client.get("/api/auth/me", headers=headers)
         assert me_resp.status_code == 200
         user = me_resp.json()
-        assert user["email"] == "e2e@example.com"
-        assert user["full_name"] == "E2E User"
-        workspace_id = user["workspace_id"]
+        assert user["email"] == E2E_USER["email"]
+        assert user["full_name"] == E2E_USER["full_name"]
 
         # Step 3: Access workspace
         ws_resp = await client.get("/api/workspace", headers=headers)
         assert ws_resp.status_code == 200
-        assert ws_resp.json()["id"] == workspace_id
+        assert ws_resp.json()["id"] == user["workspace_id"]
+
+    async def test_new_workspace_starts_empty(
+        self, client: AsyncClient, registered_user, auth_headers
+    ):
+        """Read-only checks reuse the module's registered user instead of registering."""
+        ws_resp = await client.get("/api/workspace", headers=auth_headers)
+        assert ws_resp.status_code == 200
+        assert ws_resp.json()["id"] == registered_user["workspace_id"]
 
-        # Step 4: List datasets (should be empty)
-        ds_resp = await client.get("/api/datasets", headers=headers)
+        ds_resp = await client.get("/api/datasets", headers=auth_headers)
         assert ds_resp.status_code == 200
         assert ds_resp.json() == []
 
-        # Step 5: List model runs (should be empty)
-        mr_resp = await client.get("/api/models", headers=headers)
+        mr_resp = await client.get("/api/models", headers=auth_headers)
         assert mr_resp.status_code == 200
         assert mr_resp.json() == []
 
@@ -85,29 +98,11 @@ class TestFullUserFlow:
 class TestWorkspaceIsolation:
     """Verify that users from different workspaces cannot see each other's data."""
 
-    async def test_separate_workspaces(self, client: AsyncClient):
-        # Register two users in separate workspaces
-        resp1 = await client.post(
-            "/api/auth/register",
-            json={
-                "email": "user_a@iso.com",
-                "password": "PassA123!",
-                "full_name": "User A",
-                "workspace_name": "Workspace A",
-            },
-        )
-        assert resp1.status_code == 201
-        headers_a = {"Authorization": f"Bearer {resp1.json()['access_token']}"}
+    async def test_separate_workspaces(self, client: AsyncClient, auth_headers):
+        # User A is the module's registered user; register B in a new workspace
+        headers_a = auth_headers
 
-        resp2 = await client.post(
-            "/api/auth/register",
-            json={
-                "email": "user_b@iso.com",
-                "password": "PassB123!",
-                "full_name": "User B",
-                "workspace_name": "Workspace B",
-            },
-        )
+        resp2 = await client.post("/api/auth/register", json=USER_B)
         assert resp2.status_code == 201
         headers_b = {"Authorization": f"Bearer {resp2.json()['access_token']}"}
 
@@ -1,43 +1,52 @@
 """Tests for the budget optimizer service."""
 
+import numpy as np
 import pytest
 
 from app.services.budget_optimizer import BudgetOptimizer
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_response_curves():
-    """Response curves data as would be stored in model results."""
+    """Response curves data as would be stored in model results.
+
+    Stored results hold lists; here the curves are float64 arrays built
+    once, which the optimizer uses without converting on every call.
+    """
     return {
         "google_ads": {
-            "spend_levels": [0, 500, 1000, 1500, 2000, 2500, 3000],
-            "predicted_contribution": [0, 800, 1400, 1800, 2050, 2200, 2300],
+            "spend_levels": np.array([0, 500, 1000, 1500, 2000, 2500, 3000], dtype=np.float64),
+            "predicted_contribution": np.array([0, 800, 1400, 1800, 2050, 2200, 2300], dtype=np.float64),
             "current_spend": 1500,
             "current_contribution": 1800,
         },
         "facebook": {
-            "spend_levels": [0, 500, 1000, 1500, 2000, 2500, 3000],
-            "predicted_contribution": [0, 600, 1100, 1500, 1700, 1850, 1950],
+            "spend_levels": np.array([0, 500, 1000, 1500, 2000, 2500, 3000], dtype=np.float64),
+            "predicted_contribution": np.array([0, 600, 1100, 1500, 1700, 1850, 1950], dtype=np.float64),
             "current_spend": 1000,
             "current_contribution": 1100,
         },
         "tv": {
-            "spend_levels": [0, 500, 1000, 1500, 2000, 2500, 3000],
-            "predicted_contribution": [0, 400, 700, 950, 1150, 1300, 1400],
+            "spend_levels": np.array([0, 500, 1000, 1500, 2000, 2500, 3000], dtype=np.float64),
+            "predicted_contribution": np.array([0, 400, 700, 950, 1150, 1300, 1400], dtype=np.float64),
             "current_spend": 500,
             "current_contribution": 400,
         },
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def model_results(sample_response_curves):
     return {"response_curves": sample_response_curves}
 
 
+@pytest.fixture(scope="module")
+def optimizer():
+    return BudgetOptimizer()
+
+
 class TestBudgetOptimizer:
-    def test_returns_expected_keys(self, model_results):
-        optimizer = BudgetOptimizer()
+    def test_returns_expected_keys(self, optimizer, model_results):
         result = optimizer.optimize(model_results, total_budget=3000)
         assert "allocations" in result
         assert "predicted_contributions" in result
@@ -47,14 +56,12 @@ class TestBudgetOptimizer:
         assert "total_current_contribution" in result
         assert "improvement_pct" in result
 
-    def test_allocations_sum_to_budget(self, model_results):
-        optimizer = BudgetOptimizer()
+    def test_allocations_sum_to_budget(self, optimizer, model_results):
         result = optimizer.optimize(model_results, total_budget=3000)
         total = sum(result["allocations"].values())
         assert abs(total - 3000) < 1.0  # Allow small floating point error
 
-    def test_all_channels_present(self, model_results, sample_response_curves):
-        optimizer = BudgetOptimizer()
+    def test_all_channels_present(self, optimizer, model_results, sample_response_curves):
         result = optimizer.optimize(model_results, total_budget=3000)
         for ch in sample_response_curves:
             assert ch in result["allocations"]
@@ -62,18 +69,15 @@ class TestBudgetOptimizer:
             assert ch in result["current_allocations"]
             assert ch in result["current_contributions"]
 
-    def test_improvement_pct_is_float(self, model_results):
-        optimizer = BudgetOptimizer()
+    def test_improvement_pct_is_float(self, optimizer, model_results):
         result = optimizer.optimize(model_results, total_budget=3000)
         assert isinstance(result["improvement_pct"], float)
 
-    def test_optimal_beats_or_matches_current(self, model_results):
-        optimizer = BudgetOptimizer()
+    def test_optimal_beats_or_matches_current(self, optimizer, model_results):
         result = optimizer.optimize(model_results, total_budget=3000)
         assert result["total_predicted_contribution"] >= result["total_current_contribution"] - 1.0
 
-    def test_respects_min_constraint(self, model_results):
-        optimizer = BudgetOptimizer()
+    def test_respects_min_constraint(self, optimizer, model_results):
         result = optimizer.optimize(
             model_results,
             total_budget=3000,
@@ -81,8 +85,7 @@ class TestBudgetOptimizer:
         )
         assert result["allocations"]["tv"] >= 999.0  # Allow small floating point
 
-    def test_respects_max_constraint(self, model_results):
-        optimizer = BudgetOptimizer()
+    def test_respects_max_constraint(self, optimizer, model_results):
         result = optimizer.optimize(
             model_results,
             total_budget=3000,
@@ -90,14 +93,26 @@ class TestBudgetOptimizer:
         )
         assert result["allocations"]["google_ads"] <= 501.0  # Allow small floating point
 
-    def test_raises_on_missing_curves(self):
-        optimizer = BudgetOptimizer()
+    def test_raises_on_missing_curves(self, optimizer):
         with pytest.raises(ValueError, match="No response curves"):
             optimizer.optimize({}, total_budget=3000)
 
-    def test_different_budget_levels(self, model_results):
-        optimizer = BudgetOptimizer()
+    def test_different_budget_levels(self, optimizer, model_results):
         result_low = optimizer.optimize(model_results, total_budget=1000)
         result_high = optimizer.optimize(model_results, total_budget=5000)
         assert abs(sum(result_low["allocations"].values()) - 1000) < 1.0
         assert abs(sum(result_high["allocations"].values()) - 5000) < 1.0
+
+    def test_list_curves_match_array_curves(self, optimizer, model_results, sample_response_curves):
+        # Results loaded from the database hold plain lists, not arrays
+        list_curves = {
+            ch: {
+                **curve,
+                "spend_levels": curve["spend_levels"].tolist(),
+                "predicted_contribution": curve["predicted_contribution"].tolist(),
+            }
+            for ch, curve in sample_response_curves.items()
+        }
+        from_lists = optimizer.optimize({"response_curves": list_curves}, total_budget=3000)
+        from_arrays = optimizer.optimize(model_results, total_budget=3000)
+        assert from_lists == from_arrays
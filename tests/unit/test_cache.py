@@ -1,10 +1,22 @@
 """Tests for the cache service."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import Mock, patch
 
 from app.services.cache import get_cached, invalidate, set_cached
 
 
+class FakeRedis:
+    """Just the Redis calls the cache service makes; cheaper than a MagicMock."""
+
+    def __init__(self, stored: str | None = None):
+        self._stored = stored
+        self.setex = Mock()
+        self.delete = Mock()
+
+    def get(self, key: str) -> str | None:
+        return self._stored
+
+
 class TestCacheService:
     @patch("app.services.cache.get_redis")
     def test_get_cached_returns_none_when_no_redis(self, mock_get_redis):
@@ -13,22 +25,20 @@ class TestCacheService:
 
     @patch("app.services.cache.get_redis")
     def test_get_cached_returns_parsed_json(self, mock_get_redis):
-        mock_redis = MagicMock()
-        mock_redis.get.return_value = '{"key": "value"}'
+        mock_redis = FakeRedis('{"key": "value"}')
         mock_get_redis.return_value = mock_redis
         result = get_cached("test-key")
         assert result == {"key": "value"}
 
     @patch("app.services.cache.get_redis")
     def test_get_cached_returns_none_on_miss(self, mock_get_redis):
-        mock_redis = MagicMock()
-        mock_redis.get.return_value = None
+        mock_redis = FakeRedis()
         mock_get_redis.return_value = mock_redis
         assert get_cached("missing-key") is None
 
     @patch("app.services.cache.get_redis")
     def test_set_cached_calls_setex(self, mock_get_redis):
-        mock_redis = MagicMock()
+        mock_redis = FakeRedis()
         mock_get_redis.return_value = mock_redis
         set_cached("test-key", {"data": True}, ttl_seconds=600)
         mock_redis.setex.assert_called_once()
@@ -44,7 +54,7 @@ class TestCacheService:
 
     @patch("app.services.cache.get_redis")
     def test_invalidate_calls_delete(self, mock_get_redis):
-        mock_redis = MagicMock()
+        mock_redis = FakeRedis()
         mock_get_redis.return_value = mock_redis
         invalidate("test-key")
         mock_redis.delete.assert_called_once_with("test-key")
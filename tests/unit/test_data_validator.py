@@ -6,13 +6,16 @@ import pytest
 
 from app.services.data_validator import DataValidator
 
+# Pin the module to one xdist worker so its module-scoped fixtures are built once.
+pytestmark = pytest.mark.xdist_group("validator")
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def validator():
     return DataValidator()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_mapping():
     return {
         "date_column": "week_start",
@@ -25,20 +28,53 @@ def valid_mapping():
     }
 
 
-def _make_df(n_weeks: int = 104, seed: int = 42) -> pd.DataFrame:
-    """Helper to generate a valid baseline dataframe."""
+_NUMERIC_COLUMNS = ["revenue", "tv_spend", "meta_spend", "temperature"]
+
+
+def _baseline_block(n_weeks: int, seed: int = 42) -> np.ndarray:
+    """Numeric baseline columns as one (n_weeks, 4) float64 block."""
     rng = np.random.default_rng(seed)
-    dates = pd.date_range(start="2022-01-03", periods=n_weeks, freq="W-MON")
-    return pd.DataFrame(
-        {
-            "week_start": dates,
-            "revenue": rng.normal(50000, 5000, n_weeks).clip(min=1),
-            "tv_spend": rng.lognormal(10, 0.5, n_weeks),
-            "meta_spend": rng.lognormal(9, 0.5, n_weeks),
-            "temperature": 15 + 10 * np.sin(2 * np.pi * np.arange(n_weeks) / 52),
-            "holiday_flag": np.zeros(n_weeks),
-        }
-    )
+    block = np.empty((n_weeks, len(_NUMERIC_COLUMNS)))
+    block[:, 0] = rng.normal(50000, 5000, n_weeks).clip(min=1)
+    block[:, 1] = rng.lognormal(10, 0.5, n_weeks)
+    block[:, 2] = rng.lognormal(9, 0.5, n_weeks)
+    block[:, 3] = 15 + 10 * np.sin(2 * np.pi * np.arange(n_weeks) / 52)
+    return block
+
+
+# Drawn once at import; shorter frames take a prefix of the rows.
+_BASELINE_WEEKS = 104
+_BASELINE = _baseline_block(_BASELINE_WEEKS)
+_BASELINE_DATES = pd.date_range(start="2022-01-03", periods=_BASELINE_WEEKS, freq="W-MON")
+
+# Replacement columns for the high-correlation and skewed-target cases.
+_META_HIGH_CORR = _BASELINE[:, 1] * 1.01 + 0.5
+_SKEWED_REVENUE = np.exp(np.random.default_rng(42).normal(10, 2, _BASELINE_WEEKS))
+
+
+def _make_df(n_weeks: int = 104) -> pd.DataFrame:
+    """Helper to generate a valid baseline dataframe."""
+    if n_weeks <= _BASELINE_WEEKS:
+        block = _BASELINE[:n_weeks]
+        dates = _BASELINE_DATES[:n_weeks]
+    else:
+        block = _baseline_block(n_weeks)
+        dates = pd.date_range(start="2022-01-03", periods=n_weeks, freq="W-MON")
+    # copy=True keeps the frame from viewing the shared module-level block
+    df = pd.DataFrame(block, columns=_NUMERIC_COLUMNS, copy=True)
+    df.insert(0, "week_start", dates)
+    df["holiday_flag"] = 0.0
+    return df
+
+
+def _has_code(items: list[dict], code: str) -> bool:
+    return any(item["code"] == code for item in items)
+
+
+@pytest.fixture(scope="module")
+def base_df():
+    """Shared 104-week baseline. Tests that modify it must work on a copy."""
+    return _make_df(104)
 
 
 # ---------------------------------------------------------------------------
@@ -47,15 +83,13 @@ def _make_df(n_weeks: int = 104, seed: int = 42) -> pd.DataFrame:
 
 
 class TestValidData:
-    def test_valid_104_week_dataset(self, validator, valid_mapping):
-        df = _make_df(104)
-        result = validator.validate(df, valid_mapping)
+    def test_valid_104_week_dataset(self, validator, valid_mapping, base_df):
+        result = validator.validate(base_df, valid_mapping)
         assert result["is_valid"] is True
         assert len(result["errors"]) == 0
 
-    def test_valid_data_has_summary(self, validator, valid_mapping):
-        df = _make_df(104)
-        result = validator.validate(df, valid_mapping)
+    def test_valid_data_has_summary(self, validator, valid_mapping, base_df):
+        result = validator.validate(base_df, valid_mapping)
         summary = result["data_summary"]
         assert summary["row_count"] == 104
         assert summary["media_channel_count"] == 2
@@ -69,51 +103,88 @@ class TestValidData:
 # ---------------------------------------------------------------------------
 
 
+# Mutators take the shared baseline and return a modified frame. Ones that
+# only replace whole columns use a shallow copy, which shares the untouched
+# columns; ones that write into existing cells need a deep copy.
+
+
+def _negative_spend(base):
+    df = base.copy()
+    df.at[0, "tv_spend"] = -100.0
+    return df
+
+
+def _all_zero_target(base):
+    df = base.copy(deep=False)
+    df["revenue"] = 0.0
+    return df
+
+
+def _invalid_dates(base):
+    df = base.copy(deep=False)
+    # Convert to object dtype first so we can inject a bad string
+    df["week_start"] = df["week_start"].astype(object)
+    df.at[0, "week_start"] = "not-a-date"
+    return df
+
+
+def _high_correlation(base):
+    df = base.copy(deep=False)
+    # Make meta_spend nearly identical to tv_spend
+    df["meta_spend"] = _META_HIGH_CORR
+    return df
+
+
+def _missing_values(base):
+    df = base.copy()
+    # Set 10% of revenue to NaN
+    df.loc[df.index[:11], "revenue"] = np.nan
+    return df
+
+
+def _zero_variance(base):
+    df = base.copy(deep=False)
+    df["temperature"] = 20.0  # Constant value
+    return df
+
+
 class TestErrors:
     def test_too_few_rows(self, validator, valid_mapping):
         df = _make_df(30)
         result = validator.validate(df, valid_mapping)
         assert result["is_valid"] is False
-        error_codes = [e["code"] for e in result["errors"]]
-        assert "min_rows" in error_codes
-
-    def test_negative_spend(self, validator, valid_mapping):
-        df = _make_df(104)
-        df.loc[0, "tv_spend"] = -100.0
-        result = validator.validate(df, valid_mapping)
-        assert result["is_valid"] is False
-        error_codes = [e["code"] for e in result["errors"]]
-        assert "negative_spend" in error_codes
-
-    def test_all_zero_target(self, validator, valid_mapping):
-        df = _make_df(104)
-        df["revenue"] = 0.0
+        assert _has_code(result["errors"], "min_rows")
+
+    @pytest.mark.parametrize(
+        "mutate, code",
+        [
+            pytest.param(_negative_spend, "negative_spend", id="negative_spend"),
+            pytest.param(_all_zero_target, "target_all_zero", id="target_all_zero"),
+            pytest.param(
+                _invalid_dates,
+                "invalid_dates",
+                id="invalid_dates",
+                # Expected: pandas falls back to dateutil for the mixed column
+                marks=pytest.mark.filterwarnings("ignore:Could not infer format:UserWarning"),
+            ),
+        ],
+    )
+    def test_blocking_error(self, validator, valid_mapping, base_df, mutate, code):
+        df = mutate(base_df)
         result = validator.validate(df, valid_mapping)
         assert result["is_valid"] is False
-        error_codes = [e["code"] for e in result["errors"]]
-        assert "target_all_zero" in error_codes
+        assert _has_code(result["errors"], code)
 
-    def test_no_media_columns(self, validator):
-        df = _make_df(104)
+    def test_no_media_columns(self, validator, base_df):
         mapping = {
             "date_column": "week_start",
             "target_column": "revenue",
             "media_columns": {},
             "control_columns": [],
         }
-        result = validator.validate(df, mapping)
+        result = validator.validate(base_df, mapping)
         assert result["is_valid"] is False
-        error_codes = [e["code"] for e in result["errors"]]
-        assert "no_media_cols" in error_codes
-
-    def test_invalid_dates(self, validator, valid_mapping):
-        df = _make_df(104)
-        # Convert to object dtype first so we can inject a bad string
-        df["week_start"] = df["week_start"].astype(object)
-        df.loc[0, "week_start"] = "not-a-date"
-        result = validator.validate(df, valid_mapping)
-        error_codes = [e["code"] for e in result["errors"]]
-        assert "invalid_dates" in error_codes
+        assert _has_code(result["errors"], "no_media_cols")
 
 
 # ---------------------------------------------------------------------------
@@ -126,31 +197,20 @@ class TestWarnings:
         df = _make_df(60)
         result = validator.validate(df, valid_mapping)
         assert result["is_valid"] is True  # Not blocking
-        warning_codes = [w["code"] for w in result["warnings"]]
-        assert "low_rows" in warning_codes
-
-    def test_high_correlation_warning(self, validator, valid_mapping):
-        df = _make_df(104)
-        # Make meta_spend nearly identical to tv_spend
-        df["meta_spend"] = df["tv_spend"] * 1.01 + 0.5
-        result = validator.validate(df, valid_mapping)
-        warning_codes = [w["code"] for w in result["warnings"]]
-        assert "high_correlation" in warning_codes
-
-    def test_missing_values_warning(self, validator, valid_mapping):
-        df = _make_df(104)
-        # Set 10% of revenue to NaN
-        df.loc[df.index[:11], "revenue"] = np.nan
-        result = validator.validate(df, valid_mapping)
-        warning_codes = [w["code"] for w in result["warnings"]]
-        assert "high_nulls" in warning_codes
-
-    def test_zero_variance_warning(self, validator, valid_mapping):
-        df = _make_df(104)
-        df["temperature"] = 20.0  # Constant value
+        assert _has_code(result["warnings"], "low_rows")
+
+    @pytest.mark.parametrize(
+        "mutate, code",
+        [
+            pytest.param(_high_correlation, "high_correlation", id="high_correlation"),
+            pytest.param(_missing_values, "high_nulls", id="high_nulls"),
+            pytest.param(_zero_variance, "zero_variance", id="zero_variance"),
+        ],
+    )
+    def test_warning(self, validator, valid_mapping, base_df, mutate, code):
+        df = mutate(base_df)
         result = validator.validate(df, valid_mapping)
-        warning_codes = [w["code"] for w in result["warnings"]]
-        assert "zero_variance" in warning_codes
+        assert _has_code(result["warnings"], code)
 
 
 # ---------------------------------------------------------------------------
@@ -159,8 +219,7 @@ class TestWarnings:
 
 
 class TestSuggestions:
-    def test_no_seasonality_suggestion(self, validator):
-        df = _make_df(104)
+    def test_no_seasonality_suggestion(self, validator, base_df):
         mapping = {
             "date_column": "week_start",
             "target_column": "revenue",
@@ -169,14 +228,12 @@ class TestSuggestions:
             },
             "control_columns": ["temperature"],  # No holiday/season variable
         }
-        result = validator.validate(df, mapping)
-        suggestion_codes = [s["code"] for s in result["suggestions"]]
-        assert "add_seasonality" in suggestion_codes
+        result = validator.validate(base_df, mapping)
+        assert _has_code(result["suggestions"], "add_seasonality")
 
-    def test_skewed_target_suggestion(self, validator, valid_mapping):
-        df = _make_df(104)
+    def test_skewed_target_suggestion(self, validator, valid_mapping, base_df):
+        df = base_df.copy(deep=False)
         # Create highly skewed target
-        df["revenue"] = np.exp(np.random.default_rng(42).normal(10, 2, 104))
+        df["revenue"] = _SKEWED_REVENUE
         result = validator.validate(df, valid_mapping)
-        suggestion_codes = [s["code"] for s in result["suggestions"]]
-        assert "log_transform" in suggestion_codes
+        assert _has_code(result["suggestions"], "log_transform")
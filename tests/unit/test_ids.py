@@ -0,0 +1,20 @@
+"""Tests for time-ordered ID generation."""
+
+import uuid
+
+from app.core.ids import new_id
+
+
+class TestNewId:
+    def test_is_uuid_v7(self):
+        parsed = uuid.UUID(new_id())
+        assert parsed.version == 7
+        assert parsed.variant == uuid.RFC_4122
+
+    def test_ids_are_unique_and_sorted(self):
+        ids = [new_id() for _ in range(10_000)]
+        assert len(set(ids)) == len(ids)
+        assert ids == sorted(ids)
+
+    def test_fits_existing_id_columns(self):
+        assert len(new_id()) == 36
@@ -0,0 +1,398 @@
+"""Tests for the model-fitting Celery task helpers."""
+
+import io
+import json
+import pickle
+import sys
+import threading
+import time
+import types
+from contextlib import contextmanager
+from datetime import datetime
+
+import numpy as np
+import pytest
+import zstandard as zstd
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.models import Dataset, ModelRun
+from app.services import results_transformer, storage
+from app.tasks import model_tasks
+
+# Bound on every wait, so a regression fails the test instead of hanging it
+WAIT_S = 5
+
+
+class FakeRedis:
+    """Records what the worker publishes; pipelines apply on execute()."""
+
+    def __init__(self):
+        self.published: list[tuple[str, dict]] = []
+        self.heartbeats: dict[str, int] = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._ops = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def publish(self, channel, message):
+        self._ops.append(lambda: self._redis.published.append((channel, json.loads(message))))
+
+    def setex(self, key, ttl, value):
+        self._ops.append(lambda: self._redis.heartbeats.__setitem__(key, value))
+
+    def execute(self):
+        for op in self._ops:
+            op()
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(model_tasks, "_get_redis", lambda: fake)
+    return fake
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(model_tasks, "time", types.SimpleNamespace(monotonic=clock.monotonic))
+    return clock
+
+
+@pytest.fixture
+def db_engine(monkeypatch):
+    # Looked up per call so tests can swap the serializer
+    engine = create_engine("sqlite://", json_serializer=lambda obj: model_tasks._json_serializer(obj))
+    Dataset.__table__.create(engine)
+    ModelRun.__table__.create(engine)
+    monkeypatch.setattr(model_tasks, "_db_engine", engine)
+    yield engine
+    engine.dispose()
+
+
+STARTED_AT = datetime(2026, 1, 5, 9, 30)
+
+
+@pytest.fixture
+def run_id(db_engine):
+    with Session(db_engine) as db:
+        run = ModelRun(
+            workspace_id="ws-1",
+            dataset_id="ds-1",
+            name="Q1 fit",
+            status="fitting",
+            progress=25,
+            config={"channels": ["tv"]},
+            started_at=STARTED_AT,
+        )
+        db.add(run)
+        db.commit()
+        return run.id
+
+
+@pytest.fixture
+def queued_run_id(db_engine):
+    with Session(db_engine) as db:
+        dataset = Dataset(
+            workspace_id="ws-1",
+            filename="spend.csv",
+            s3_key="datasets/ws-1/spend.csv",
+            column_mapping={"date_column": "week", "target_column": "revenue"},
+        )
+        db.add(dataset)
+        db.flush()
+        run = ModelRun(workspace_id="ws-1", dataset_id=dataset.id, name="Q1 fit", config={"channels": ["tv"]})
+        db.add(run)
+        db.commit()
+        return run.id
+
+
+class StubStorage:
+    """StorageService stand-in whose transfers can be made to block or fail."""
+
+    def __init__(self):
+        self.download_started = threading.Event()
+        self.release_download = threading.Event()
+        self.download_error: Exception | None = None
+        self.block_download = False
+        self.objects: dict[str, bytes] = {}
+        self.aborted: list[str] = []
+
+    def download_arrow(self, s3_key, parquet_s3_key=None):
+        self.download_started.set()
+        if self.block_download:
+            self.release_download.wait(WAIT_S)
+        if self.download_error is not None:
+            raise self.download_error
+        return {"rows": 3}
+
+    @contextmanager
+    def upload_stream(self, key, content_type="application/octet-stream", content_encoding=None):
+        buf = io.BytesIO()
+        try:
+            yield buf
+        except BaseException:
+            self.aborted.append(key)
+            raise
+        self.objects[key] = buf.getvalue()
+
+
+class FakeEngine:
+    """Stands in for PyMCMMMEngine; serialize_model can be held mid-upload."""
+
+    upload_started = threading.Event()
+    release_upload = threading.Event()
+    block_upload = False
+
+    def __init__(self, config):
+        self.config = config
+
+    def prepare_data(self, table, mapping):
+        return table
+
+    def build_model(self, prepared):
+        pass
+
+    def fit(self, prepared, progress_callback=None):
+        progress_callback(100, "Sampling complete")
+
+    def extract_results(self):
+        return "results"
+
+    def serialize_model(self, fileobj):
+        fileobj.write(pickle.dumps({"config": self.config}))
+        fileobj.flush()
+        FakeEngine.upload_started.set()
+        if FakeEngine.block_upload:
+            FakeEngine.release_upload.wait(WAIT_S)
+            fileobj.write(b"more")
+            fileobj.flush()
+
+
+@pytest.fixture
+def stub_storage(monkeypatch):
+    stub = StubStorage()
+    monkeypatch.setattr(storage, "StorageService", lambda: stub)
+    return stub
+
+
+@pytest.fixture
+def engine_module(monkeypatch):
+    FakeEngine.upload_started = threading.Event()
+    FakeEngine.release_upload = threading.Event()
+    FakeEngine.block_upload = False
+    module = types.ModuleType("app.engine.pymc_engine")
+    module.PyMCMMMEngine = FakeEngine
+    monkeypatch.setitem(sys.modules, "app.engine.pymc_engine", module)
+    monkeypatch.setattr(results_transformer, "transform_results", lambda results: {"summary": results})
+    return module
+
+
+@pytest.fixture
+def task_env(fake_redis, stub_storage, engine_module):
+    yield stub_storage
+    # Never leave a stub transfer blocked past the test
+    stub_storage.release_download.set()
+    FakeEngine.release_upload.set()
+
+
+def _join_io_thread(run_id):
+    for thread in threading.enumerate():
+        if thread.name.startswith(f"mmm-io-{run_id[:8]}"):
+            thread.join(WAIT_S)
+            assert not thread.is_alive()
+
+
+class TestJsonSerializer:
+    def test_non_string_and_numpy_keys(self):
+        payload = {
+            "curves": {1: [np.float64(0.5)], 2.5: np.array([1, 2]), np.int64(3): np.int64(7)},
+            "weights": {np.float64(0.25): np.float32(1.5)},
+        }
+        assert json.loads(model_tasks._json_serializer(payload)) == {
+            "curves": {"1": [0.5], "2.5": [1, 2], "3": 7},
+            "weights": {"0.25": 1.5},
+        }
+
+    def test_nan_is_written_as_null(self):
+        assert model_tasks._json_serializer({"mape": float("nan")}) == '{"mape":null}'
+
+
+class TestProgressCallback:
+    def _row(self, db_engine, run_id) -> ModelRun:
+        with Session(db_engine) as db:
+            return db.get(ModelRun, run_id)
+
+    def _progress(self, fake_redis) -> list[int]:
+        return [event["progress"] for _, event in fake_redis.published]
+
+    def test_repeated_ticks_suppressed_within_interval(self, db_engine, run_id, fake_redis, clock):
+        with Session(db_engine) as db:
+            callback = model_tasks._make_progress_callback(db, run_id, start=25)
+            callback(0, "warming up")
+            clock.now += model_tasks.PROGRESS_MIN_INTERVAL_S - 0.1
+            callback(0, "warming up")
+            assert fake_redis.published == []
+
+            clock.now += 0.1
+            callback(0, "still warming up")
+            assert self._progress(fake_redis) == [25]
+            callback(0, "still warming up")
+            assert self._progress(fake_redis) == [25]
+
+            # A new percentage is published straight away
+            callback(2, "sampling")
+            assert self._progress(fake_redis) == [25, 26]
+        assert fake_redis.heartbeats == {f"model_heartbeat:{run_id}": 26}
+
+    def test_db_written_at_each_commit_step(self, db_engine, run_id, fake_redis, clock):
+        committed = []
+        with Session(db_engine) as db:
+            callback = model_tasks._make_progress_callback(db, run_id, start=25)
+            for pct in range(0, 100, 2):
+                callback(pct, "sampling")
+                committed.append(self._row(db_engine, run_id).progress)
+
+        steps = sorted(set(committed))
+        assert steps[0] == 25
+        assert all(b - a >= model_tasks.PROGRESS_COMMIT_STEP for a, b in zip(steps, steps[1:]))
+        assert all(b - a < 2 * model_tasks.PROGRESS_COMMIT_STEP for a, b in zip(steps, steps[1:]))
+        # Every distinct percentage is still published
+        assert self._progress(fake_redis) == sorted(set(self._progress(fake_redis)))
+        assert len(fake_redis.published) > len(steps)
+
+    def test_completion_always_goes_through(self, db_engine, run_id, fake_redis, clock):
+        with Session(db_engine) as db:
+            callback = model_tasks._make_progress_callback(db, run_id, start=25)
+            callback(95, "almost there")
+            callback(97, "almost there")
+            assert self._row(db_engine, run_id).progress == 82
+
+            # Inside both the interval and the commit step, but final
+            callback(100, "sampling complete")
+            assert self._row(db_engine, run_id).progress == 85
+            callback(100, "sampling complete")
+        assert self._progress(fake_redis) == [82, 83, 85, 85]
+
+    def test_update_only_touches_progress_and_status(self, db_engine, run_id, fake_redis, clock):
+        with Session(db_engine) as db:
+            callback = model_tasks._make_progress_callback(db, run_id, start=25)
+            callback(50, "sampling")
+
+        row = self._row(db_engine, run_id)
+        assert (row.progress, row.status) == (55, "fitting")
+        assert row.started_at == STARTED_AT
+        assert row.config == {"channels": ["tv"]}
+        assert row.created_at is not None
+
+
+class TestRunMmmModel:
+    def _row(self, db_engine, run_id) -> ModelRun:
+        with Session(db_engine) as db:
+            return db.get(ModelRun, run_id)
+
+    def test_completes_and_stores_compressed_artifact(self, db_engine, queued_run_id, task_env):
+        model_tasks.run_mmm_model.run(queued_run_id)
+
+        row = self._row(db_engine, queued_run_id)
+        assert (row.status, row.progress) == ("completed", 100)
+        assert row.results == {"summary": "results"}
+        assert row.model_artifact_s3_key == f"artifacts/ws-1/{queued_run_id}/model.pkl.zst"
+        stored = task_env.objects[row.model_artifact_s3_key]
+        assert pickle.loads(zstd.ZstdDecompressor().decompressobj().decompress(stored)) == {
+            "config": {"channels": ["tv"]}
+        }
+
+    def test_download_overlaps_engine_import(self, db_engine, queued_run_id, task_env, engine_module):
+        imported = threading.Event()
+
+        def resolve_engine(name):
+            # Only reached once the download is already in flight
+            assert task_env.download_started.wait(WAIT_S)
+            imported.set()
+            return FakeEngine
+
+        del engine_module.PyMCMMMEngine
+        engine_module.__getattr__ = resolve_engine
+        task_env.block_download = True
+        task_env.release_download = imported
+
+        model_tasks.run_mmm_model.run(queued_run_id)
+        assert self._row(db_engine, queued_run_id).status == "completed"
+
+    def test_failure_does_not_wait_for_blocked_download(self, db_engine, queued_run_id, task_env, engine_module):
+        def missing_engine(name):
+            assert task_env.download_started.wait(WAIT_S)
+            raise ImportError("No module named 'pymc'")
+
+        del engine_module.PyMCMMMEngine
+        engine_module.__getattr__ = missing_engine
+        task_env.block_download = True
+
+        started = time.monotonic()
+        with pytest.raises(ImportError):
+            model_tasks.run_mmm_model.run(queued_run_id)
+        assert time.monotonic() - started < WAIT_S / 2
+        assert not task_env.release_download.is_set()
+
+        row = self._row(db_engine, queued_run_id)
+        assert row.status == "failed"
+        assert "pymc" in row.error_message
+        task_env.release_download.set()
+        _join_io_thread(queued_run_id)
+
+    def test_download_error_marks_run_failed(self, db_engine, queued_run_id, task_env, fake_redis):
+        task_env.download_error = OSError("connection reset")
+
+        with pytest.raises(OSError):
+            model_tasks.run_mmm_model.run(queued_run_id)
+
+        row = self._row(db_engine, queued_run_id)
+        assert (row.status, row.error_message) == ("failed", "connection reset")
+        assert fake_redis.published[-1][1]["status"] == "error"
+
+    def test_failure_aborts_in_flight_upload(self, db_engine, queued_run_id, task_env, monkeypatch):
+        FakeEngine.block_upload = True
+
+        def failing_serializer(obj):
+            # Fail the results write only once the artifact upload is under way
+            assert FakeEngine.upload_started.wait(WAIT_S)
+            raise TypeError("Type is not JSON serializable: Trace")
+
+        monkeypatch.setattr(model_tasks, "_json_serializer", failing_serializer)
+
+        started = time.monotonic()
+        with pytest.raises(Exception, match="not JSON serializable"):
+            model_tasks.run_mmm_model.run(queued_run_id)
+        assert time.monotonic() - started < WAIT_S / 2
+
+        row = self._row(db_engine, queued_run_id)
+        assert row.status == "failed"
+        assert row.model_artifact_s3_key is None
+
+        # The upload is still held inside serialize_model; its next write is refused
+        FakeEngine.release_upload.set()
+        _join_io_thread(queued_run_id)
+        artifact_key = f"artifacts/ws-1/{queued_run_id}/model.pkl.zst"
+        assert task_env.aborted == [artifact_key]
+        assert artifact_key not in task_env.objects
@@ -1,7 +1,5 @@
 """Tests for the results transformer service."""
 
-import pytest
-
 from app.engine.types import (
     AdstockResult,
     ChannelContribution,
@@ -12,129 +10,127 @@ from app.engine.types import (
     SaturationResult,
 )
 from app.services.results_transformer import transform_results
+from app.services.summary_generator import generate_executive_summary
 
-
-@pytest.fixture
-def sample_engine_results():
-    """Create a sample EngineResults for testing."""
-    return EngineResults(
-        diagnostics=Diagnostics(
-            r_squared=0.92,
-            mape=8.5,
-            r_hat_max=1.01,
-            ess_min=500.0,
-            divergences=0,
-            convergence_status="good",
+# Static, read-only inputs and output shared by every test in the module.
+SAMPLE_ENGINE_RESULTS = EngineResults(
+    diagnostics=Diagnostics(
+        r_squared=0.92,
+        mape=8.5,
+        r_hat_max=1.01,
+        ess_min=500.0,
+        divergences=0,
+        convergence_status="good",
+    ),
+    base_sales_pct=0.35,
+    base_sales_weekly_mean=50000.0,
+    channel_contributions=[
+        ChannelContribution(
+            channel="Google Ads",
+            mean=15000.0,
+            median=14800.0,
+            hdi_3=12000.0,
+            hdi_97=18000.0,
+            share_of_total=0.45,
+        ),
+        ChannelContribution(
+            channel="Facebook",
+            mean=10000.0,
+            median=9800.0,
+            hdi_3=8000.0,
+            hdi_97=12000.0,
+            share_of_total=0.30,
+        ),
+    ],
+    channel_roas=[
+        ChannelROAS(
+            channel="Google Ads",
+            mean=3.5,
+            median=3.4,
+            hdi_3=2.8,
+            hdi_97=4.2,
+        ),
+        ChannelROAS(
+            channel="Facebook",
+            mean=2.1,
+            median=2.0,
+            hdi_3=1.5,
+            hdi_97=2.7,
         ),
-        base_sales_pct=0.35,
-        base_sales_weekly_mean=50000.0,
-        channel_contributions=[
-            ChannelContribution(
-                channel="Google Ads",
-                mean=15000.0,
-                median=14800.0,
-                hdi_3=12000.0,
-                hdi_97=18000.0,
-                share_of_total=0.45,
-            ),
-            ChannelContribution(
-                channel="Facebook",
-                mean=10000.0,
-                median=9800.0,
-                hdi_3=8000.0,
-                hdi_97=12000.0,
-                share_of_total=0.30,
-            ),
-        ],
-        channel_roas=[
-            ChannelROAS(
-                channel="Google Ads",
-                mean=3.5,
-                median=3.4,
-                hdi_3=2.8,
-                hdi_97=4.2,
-            ),
-            ChannelROAS(
-                channel="Facebook",
-                mean=2.1,
-                median=2.0,
-                hdi_3=1.5,
-                hdi_97=2.7,
-            ),
-        ],
-        adstock_params=[
-            AdstockResult(
-                channel="Google Ads",
-                type="geometric",
-                alpha=0.7,
-                mean_lag_weeks=2.3,
-            ),
-            AdstockResult(
-                channel="Facebook",
-                type="geometric",
-                alpha=0.5,
-                mean_lag_weeks=1.0,
-            ),
-        ],
-        saturation_params=[
-            SaturationResult(
-                channel="Google Ads",
-                type="logistic",
-                lam=0.5,
-                saturation_pct=0.65,
-            ),
-            SaturationResult(
-                channel="Facebook",
-                type="logistic",
-                lam=0.8,
-                saturation_pct=0.40,
-            ),
-        ],
-        decomposition_ts=DecompositionTS(
-            dates=["2024-01-01", "2024-01-08"],
-            actual=[100000.0, 105000.0],
-            predicted=[99000.0, 104000.0],
-            predicted_hdi_lower=[95000.0, 100000.0],
-            predicted_hdi_upper=[103000.0, 108000.0],
-            base=[50000.0, 51000.0],
-            channels={"Google Ads": [30000.0, 32000.0], "Facebook": [19000.0, 21000.0]},
+    ],
+    adstock_params=[
+        AdstockResult(
+            channel="Google Ads",
+            type="geometric",
+            alpha=0.7,
+            mean_lag_weeks=2.3,
         ),
-    )
+        AdstockResult(
+            channel="Facebook",
+            type="geometric",
+            alpha=0.5,
+            mean_lag_weeks=1.0,
+        ),
+    ],
+    saturation_params=[
+        SaturationResult(
+            channel="Google Ads",
+            type="logistic",
+            lam=0.5,
+            saturation_pct=0.65,
+        ),
+        SaturationResult(
+            channel="Facebook",
+            type="logistic",
+            lam=0.8,
+            saturation_pct=0.40,
+        ),
+    ],
+    decomposition_ts=DecompositionTS(
+        dates=["2024-01-01", "2024-01-08"],
+        actual=[100000.0, 105000.0],
+        predicted=[99000.0, 104000.0],
+        predicted_hdi_lower=[95000.0, 100000.0],
+        predicted_hdi_upper=[103000.0, 108000.0],
+        base=[50000.0, 51000.0],
+        channels={"Google Ads": [30000.0, 32000.0], "Facebook": [19000.0, 21000.0]},
+    ),
+)
+
+TRANSFORMED = transform_results(SAMPLE_ENGINE_RESULTS)
 
 
 class TestTransformResults:
-    def test_returns_dict(self, sample_engine_results):
-        result = transform_results(sample_engine_results)
-        assert isinstance(result, dict)
-
-    def test_has_required_keys(self, sample_engine_results):
-        result = transform_results(sample_engine_results)
-        assert "diagnostics" in result
-        assert "base_sales" in result
-        assert "channel_results" in result
-        assert "decomposition_ts" in result
-        assert "summary_text" in result
-        assert "top_recommendation" in result
-
-    def test_diagnostics_structure(self, sample_engine_results):
-        result = transform_results(sample_engine_results)
-        diag = result["diagnostics"]
+    def test_returns_dict(self):
+        assert isinstance(TRANSFORMED, dict)
+
+    def test_has_required_keys(self):
+        assert "diagnostics" in TRANSFORMED
+        assert "base_sales" in TRANSFORMED
+        assert "channel_results" in TRANSFORMED
+        assert "decomposition_ts" in TRANSFORMED
+        assert "summary_text" in TRANSFORMED
+        assert "top_recommendation" in TRANSFORMED
+
+    def test_diagnostics_structure(self):
+        diag = TRANSFORMED["diagnostics"]
         assert diag["r_squared"] == 0.92
         assert diag["mape"] == 8.5
         assert diag["convergence_status"] == "good"
 
-    def test_base_sales_structure(self, sample_engine_results):
-        result = transform_results(sample_engine_results)
-        base = result["base_sales"]
+    def test_base_sales_structure(self):
+        base = TRANSFORMED["base_sales"]
         assert base["weekly_mean"] == 50000.0
         assert base["share_of_total"] == 0.35
 
-    def test_channel_results_merged(self, sample_engine_results):
-        result = transform_results(sample_engine_results)
-        channels = result["channel_results"]
+    def test_channel_results_merged(self):
+        channels = TRANSFORMED["channel_results"]
         assert len(channels) == 2
 
-        google = next(c for c in channels if c["channel"] == "Google Ads")
+        by_channel = {c["channel"]: c for c in channels}
+        assert by_channel.keys() == {"Google Ads", "Facebook"}
+
+        google = by_channel["Google Ads"]
         assert google["contribution_share"] == 0.45
         assert google["weekly_contribution_mean"] == 15000.0
         assert google["roas"]["mean"] == 3.5
@@ -143,24 +139,45 @@ class TestTransformResults:
         assert google["adstock_params"]["alpha"] == 0.7
         assert google["saturation_pct"] == 0.65
 
-    def test_summary_generated(self, sample_engine_results):
-        result = transform_results(sample_engine_results)
-        assert len(result["summary_text"]) > 0
-        assert "Google Ads" in result["summary_text"]
+    def test_summary_generated(self):
+        assert len(TRANSFORMED["summary_text"]) > 0
+        assert "Google Ads" in TRANSFORMED["summary_text"]
 
-    def test_top_recommendation_generated(self, sample_engine_results):
-        result = transform_results(sample_engine_results)
-        assert len(result["top_recommendation"]) > 0
+    def test_top_recommendation_generated(self):
+        assert len(TRANSFORMED["top_recommendation"]) > 0
 
-    def test_channel_recommendations_generated(self, sample_engine_results):
-        result = transform_results(sample_engine_results)
-        for ch in result["channel_results"]:
+    def test_channel_recommendations_generated(self):
+        for ch in TRANSFORMED["channel_results"]:
             assert "recommendation" in ch
             assert isinstance(ch["recommendation"], str)
 
-    def test_decomposition_ts_structure(self, sample_engine_results):
-        result = transform_results(sample_engine_results)
-        ts = result["decomposition_ts"]
+    def test_decomposition_ts_structure(self):
+        ts = TRANSFORMED["decomposition_ts"]
         assert ts["dates"] == ["2024-01-01", "2024-01-08"]
         assert len(ts["actual"]) == 2
         assert "Google Ads" in ts["channels"]
+
+    def test_legacy_executive_summary_sections(self):
+        # The dict-based wrapper keeps its own, shorter section set
+        summary = generate_executive_summary(TRANSFORMED, mapping={})
+        assert summary.startswith("## Marketing Mix Analysis Summary\n")
+        assert "**Highest ROI channel: Google Ads** with a return of $3.50 per dollar spent." in summary
+        assert "1. **Google Ads**: 45% of marketing effect (ROAS: $3.50)\n" in summary
+        assert summary.endswith(
+            "### Key Recommendations:\n- Current allocation appears balanced. Monitor trends over time."
+        )
+        assert "Channel Effect Duration" not in summary
+        assert "Model Quality" not in summary
+
+
+class TestEngineResultsDerived:
+    def test_rankings(self):
+        assert [c.channel for c in SAMPLE_ENGINE_RESULTS.ranked_contributions] == ["Google Ads", "Facebook"]
+        assert SAMPLE_ENGINE_RESULTS.best_roas_channel == "Google Ads"
+        assert SAMPLE_ENGINE_RESULTS.most_saturated_channel == "Google Ads"
+        assert SAMPLE_ENGINE_RESULTS.top_opportunity_channel == "Facebook"
+
+    def test_derived_values_not_serialized(self):
+        serialized = SAMPLE_ENGINE_RESULTS.to_dict()
+        for name in ("ranked_contributions", "best_roas_channel", "most_saturated_channel", "top_opportunity_channel"):
+            assert name not in serialized
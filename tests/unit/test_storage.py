@@ -0,0 +1,249 @@
+"""Tests for the storage service."""
+
+import io
+import re
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+from botocore.exceptions import ClientError
+
+from app.services import storage
+from app.services.storage import StorageService
+
+
+class StubS3:
+    """In-memory stand-in for the boto3 S3 client that records requests."""
+
+    def __init__(self):
+        self.objects: dict[str, bytes] = {}
+        self.calls: list[tuple] = []
+        self.parts: dict[str, dict[int, bytes]] = {}
+        self.aborted: list[str] = []
+
+    def head_bucket(self, Bucket):
+        pass
+
+    def upload_fileobj(self, Fileobj, Bucket, Key, ExtraArgs=None, Config=None):
+        self.objects[Key] = Fileobj.read()
+
+    def create_multipart_upload(self, Bucket, Key, ContentType, **kwargs):
+        upload_id = f"upload-{len(self.parts)}"
+        self.parts[upload_id] = {}
+        return {"UploadId": upload_id}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        self.parts[UploadId][PartNumber] = Body
+        return {"ETag": f"etag-{PartNumber}"}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        numbers = [p["PartNumber"] for p in MultipartUpload["Parts"]]
+        assert numbers == sorted(self.parts[UploadId])
+        self.objects[Key] = b"".join(self.parts[UploadId][n] for n in numbers)
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.aborted.append(UploadId)
+
+    def get_object(self, Bucket, Key, Range=None):
+        self.calls.append(("get_object", Key, Range))
+        data = self.objects[Key]
+        if Range is None:
+            return {"Body": io.BytesIO(data), "ContentLength": len(data)}
+        start, end = map(int, re.fullmatch(r"bytes=(\d+)-(\d+)", Range).groups())
+        if start >= len(data):
+            raise ClientError({"Error": {"Code": "InvalidRange"}}, "GetObject")
+        end = min(end, len(data) - 1)
+        return {
+            "Body": io.BytesIO(data[start:end + 1]),
+            "ContentLength": end + 1 - start,
+            "ContentRange": f"bytes {start}-{end}/{len(data)}",
+        }
+
+
+@pytest.fixture
+def s3():
+    return StubS3()
+
+
+@pytest.fixture
+def stub_service(s3):
+    with patch("app.services.storage.boto3") as boto3:
+        boto3.client.return_value = s3
+        yield StorageService()
+
+
+@pytest.fixture
+def small_ranges():
+    """Shrink the ranged-download sizes so tests can use tiny objects."""
+    with patch.object(storage, "RANGED_DOWNLOAD_THRESHOLD", 10), patch.object(storage, "RANGED_CHUNK_SIZE", 4):
+        yield
+
+
+class TestDownload:
+    def test_small_object_is_one_get(self, stub_service, s3, small_ranges):
+        s3.objects["k"] = b"0123456789"  # exactly the threshold
+        assert stub_service.download_file("k") == b"0123456789"
+        assert s3.calls == [("get_object", "k", "bytes=0-9")]
+
+    def test_empty_object(self, stub_service, s3, small_ranges):
+        s3.objects["k"] = b""
+        assert stub_service.download_file("k") == b""
+        assert s3.calls == [("get_object", "k", "bytes=0-9"), ("get_object", "k", None)]
+
+    def test_large_object_fetched_in_ranges(self, stub_service, s3, small_ranges):
+        data = bytes(range(23))
+        s3.objects["k"] = data
+        result = stub_service.download_file("k")
+        assert isinstance(result, bytearray)
+        assert result == data
+        # Leading range, then full chunks and a final partial one (fetched concurrently)
+        ranges = [r for _, _, r in s3.calls]
+        assert ranges[0] == "bytes=0-9"
+        assert sorted(ranges[1:]) == ["bytes=10-13", "bytes=14-17", "bytes=18-21", "bytes=22-22"]
+
+    def test_object_ending_on_chunk_boundary(self, stub_service, s3, small_ranges):
+        data = bytes(range(18))
+        s3.objects["k"] = data
+        assert stub_service.download_file("k") == data
+        assert len(s3.calls) == 3  # 0-9, 10-13, 14-17
+
+    def test_large_csv_matches_small_csv(self, stub_service, s3):
+        csv = pd.DataFrame({"week": ["2024-01-01", "2024-01-08"], "spend": [1.5, 2.0]}).to_csv(index=False)
+        s3.objects["k"] = csv.encode()
+        small = stub_service.download_csv("k")
+        assert len(s3.calls) == 1
+        with patch.object(storage, "RANGED_DOWNLOAD_THRESHOLD", 10), patch.object(storage, "RANGED_CHUNK_SIZE", 4):
+            large = stub_service.download_csv("k")
+        pd.testing.assert_frame_equal(small, large)
+        # small: one GET; large: the leading 10 bytes, then the rest in 4-byte ranges
+        assert len(s3.calls) == 1 + 1 + -(-(len(csv) - 10) // 4)
+
+
+@pytest.fixture
+def small_parts():
+    with patch.object(storage, "MULTIPART_PART_SIZE", 8):
+        yield
+
+
+class TestUploadStream:
+    def test_splits_parts_at_part_size(self, stub_service, s3, small_parts):
+        with stub_service.upload_stream("k") as writer:
+            for chunk in (b"aaaaa", b"bbbbb", b"cccccccccc"):
+                writer.write(chunk)
+        assert [len(p) for p in s3.parts["upload-0"].values()] == [8, 8, 4]
+        assert s3.objects["k"] == b"aaaaabbbbbcccccccccc"
+
+    def test_exact_multiple_has_no_empty_final_part(self, stub_service, s3, small_parts):
+        with stub_service.upload_stream("k") as writer:
+            writer.write(b"x" * 16)
+        assert [len(p) for p in s3.parts["upload-0"].values()] == [8, 8]
+
+    def test_empty_stream_uploads_one_empty_part(self, stub_service, s3, small_parts):
+        with stub_service.upload_stream("k"):
+            pass
+        assert s3.parts["upload-0"] == {1: b""}
+        assert s3.objects["k"] == b""
+
+    def test_aborts_on_exception(self, stub_service, s3, small_parts):
+        with pytest.raises(RuntimeError):
+            with stub_service.upload_stream("k") as writer:
+                writer.write(b"x" * 10)
+                raise RuntimeError("boom")
+        assert s3.aborted == ["upload-0"]
+        assert "k" not in s3.objects
+        with pytest.raises(ValueError):
+            writer.write(b"more")
+
+    def test_aborts_when_completion_fails(self, stub_service, s3, small_parts):
+        def fail(**kwargs):
+            raise ClientError({"Error": {"Code": "InternalError"}}, "CompleteMultipartUpload")
+
+        s3.complete_multipart_upload = fail
+        with pytest.raises(ClientError):
+            with stub_service.upload_stream("k") as writer:
+                writer.write(b"x" * 10)
+        assert s3.aborted == ["upload-0"]
+        assert "k" not in s3.objects
+
+    def test_aborts_when_final_part_fails(self, stub_service, s3, small_parts):
+        upload_part = s3.upload_part
+
+        def fail_short_part(**kwargs):
+            if len(kwargs["Body"]) < 8:
+                raise ClientError({"Error": {"Code": "InternalError"}}, "UploadPart")
+            return upload_part(**kwargs)
+
+        s3.upload_part = fail_short_part
+        with pytest.raises(ClientError):
+            with stub_service.upload_stream("k") as writer:
+                writer.write(b"x" * 10)
+        assert s3.aborted == ["upload-0"]
+
+
+class TestParquet:
+    def test_round_trip_through_download_arrow(self, stub_service, s3):
+        df = pd.DataFrame({"week": ["2024-01-01", "2024-01-08"], "spend": [1.5, 2.0]})
+        stub_service.upload_parquet("data.parquet", df)
+        table = stub_service.download_arrow("data.csv", "data.parquet")
+        pd.testing.assert_frame_equal(table.to_pandas(), df)
+        assert all(key == "data.parquet" for _, key, _ in s3.calls)
+
+    def test_download_arrow_falls_back_to_csv(self, stub_service, s3):
+        s3.objects["data.csv"] = b"week,spend\n2024-01-01,1.5\n"
+        table = stub_service.download_arrow("data.csv", None)
+        assert table.column_names == ["week", "spend"]
+        assert table.num_rows == 1
+
+
+@pytest.fixture
+def local_service(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage.settings, "storage_backend", "local")
+    monkeypatch.setattr(storage.settings, "local_storage_dir", str(tmp_path))
+    with patch("app.services.storage.boto3") as boto3:
+        svc = StorageService()
+    boto3.client.assert_not_called()
+    return svc
+
+
+class TestLocalBackend:
+    def test_upload_and_download_file(self, local_service, tmp_path):
+        local_service.upload_file("a/b.bin", b"payload")
+        assert (tmp_path / "a" / "b.bin").read_bytes() == b"payload"
+        assert local_service.download_file("a/b.bin") == b"payload"
+
+    def test_upload_fileobj_and_download_csv(self, local_service):
+        local_service.upload_fileobj("d/data.csv", io.BytesIO(b"week,spend\n2024-01-01,1.5\n"), "text/csv")
+        df = local_service.download_csv("d/data.csv")
+        assert df.columns.tolist() == ["week", "spend"]
+        assert df["spend"].tolist() == [1.5]
+
+    def test_parquet_round_trip(self, local_service):
+        df = pd.DataFrame({"week": ["2024-01-01"], "spend": [1.5]})
+        local_service.upload_parquet("d/data.parquet", df)
+        pd.testing.assert_frame_equal(local_service.download_arrow("d/data.csv", "d/data.parquet").to_pandas(), df)
+
+    def test_upload_stream_removes_file_on_error(self, local_service, tmp_path):
+        with local_service.upload_stream("art/model.pkl") as writer:
+            writer.write(b"model")
+        assert local_service.download_file("art/model.pkl") == b"model"
+        with pytest.raises(RuntimeError):
+            with local_service.upload_stream("art/other.pkl") as writer:
+                writer.write(b"partial")
+                raise RuntimeError("boom")
+        assert not (tmp_path / "art" / "other.pkl").exists()
+
+    def test_delete_file_and_prefix(self, local_service, tmp_path):
+        for key in ("ws1/a.csv", "ws1/sub/b.csv", "ws2/c.csv"):
+            local_service.upload_file(key, b"x")
+        local_service.delete_file("ws2/c.csv")
+        local_service.delete_file("ws2/missing.csv")
+        local_service.delete_prefix("ws1/")
+        assert [p for p in tmp_path.rglob("*") if p.is_file()] == []
+
+    def test_presigned_url_is_file_uri(self, local_service, tmp_path):
+        local_service.upload_file("a.csv", b"x")
+        assert local_service.generate_presigned_url("a.csv") == (tmp_path / "a.csv").resolve().as_uri()
+
+    def test_rejects_keys_outside_root(self, local_service):
+        with pytest.raises(ValueError):
+            local_service.upload_file("../escape.csv", b"x")